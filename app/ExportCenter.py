@@ -3,21 +3,40 @@ import pandas as pd
 
 from utils.export import (
     generate_codebook,
-    export_csv,
-    export_excel_full,
-    export_excel_smartpls,
-    export_spss,
-    export_stata,
-    export_rds,
-    export_metadata_json,
-    export_codebook_pdf,
-    export_codebook_html,
-    pdf_available,
+    export_bundle,
 )
 
 from app.branding import render_app_header, render_app_footer
 
 
+# ============================================================
+#  DOWNLOAD HELPERS
+# ============================================================
+_FORMAT_NAMES = {
+    "csv": "CSV",
+    "excel_full": "Excel (full dataset)",
+    "excel_smartpls": "SmartPLS Excel",
+    "spss": "SPSS",
+    "stata": "Stata",
+    "rds": "R",
+    "codebook_csv": "Codebook CSV",
+    "codebook_html": "Codebook HTML",
+    "codebook_pdf": "Codebook PDF",
+    "metadata_json": "Metadata JSON",
+}
+
+
+def _download(bundle, errors, fmt, label, file_name, mime, missing_note=None):
+    """
+    Download button for one bundle entry. A format skipped for a missing
+    optional library gets `missing_note`; failures were already warned about.
+    """
+    if fmt in bundle:
+        st.download_button(label, data=bundle[fmt], file_name=file_name, mime=mime)
+    elif missing_note and fmt not in errors:
+        st.caption(missing_note)
+
+
 # ============================================================
 # PAGE FUNCTION – REQUIRED for navigation system
 # ============================================================
@@ -79,41 +98,13 @@ def run():
     st.markdown("### Codebook Preview (first 20 rows)")
     st.dataframe(codebook_df.head(20), use_container_width=True)
 
-    # Prepare exports
-    csv_bytes = export_csv(full_df)
-    excel_full_bytes = export_excel_full(full_df)
-    excel_spls_bytes = export_excel_smartpls(items_df)
-    codebook_csv_bytes = codebook_df.to_csv(index=False).encode("utf-8")
-    codebook_html_bytes = export_codebook_html(codebook_df)
-    metadata_bytes = export_metadata_json(model_cfg, codebook_df)
-
-    # PDF export (optional)
-    pdf_ok = False
-    if pdf_available:
-        try:
-            pdf_bytes = export_codebook_pdf(codebook_df)
-            pdf_ok = True
-        except Exception as e:
-            st.warning(f"PDF export unavailable: {e}")
-
-    # SPSS/STATA/R
-    try:
-        spss_bytes = export_spss(full_df)
-        spss_ok = True
-    except:
-        spss_ok = False
-
-    try:
-        stata_bytes = export_stata(full_df)
-        stata_ok = True
-    except:
-        stata_ok = False
-
-    try:
-        rds_bytes = export_rds(full_df)
-        rds_ok = True
-    except:
-        rds_ok = False
+    # Prepare every export concurrently (same cached codebook); formats
+    # whose optional library is missing are absent from both dicts, formats
+    # that failed are reported and skipped so the rest stay downloadable
+    bundle, errors = export_bundle(model_cfg, items_df, full_df)
+
+    for fmt, exc in errors.items():
+        st.warning(f"{_FORMAT_NAMES[fmt]} export failed: {exc}")
 
     # ============================================================
     # 4. DOWNLOAD CENTER
@@ -128,19 +119,10 @@ def run():
     with colA:
         st.markdown("### General Formats")
 
-        st.download_button(
-            "📄 CSV (Full Dataset)",
-            data=csv_bytes,
-            file_name="DataSmartPLS4_full_dataset.csv",
-            mime="text/csv",
-        )
-
-        st.download_button(
-            "📊 Excel (Full Dataset)",
-            data=excel_full_bytes,
-            file_name="DataSmartPLS4_full_dataset.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
+        _download(bundle, errors, "csv", "📄 CSV (Full Dataset)",
+                  "DataSmartPLS4_full_dataset.csv", "text/csv")
+        _download(bundle, errors, "excel_full", "📊 Excel (Full Dataset)",
+                  "DataSmartPLS4_full_dataset.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
     # -----------------------------
     # Column B — SmartPLS + Codebooks
@@ -148,43 +130,17 @@ def run():
     with colB:
         st.markdown("### SmartPLS & Codebook")
 
-        st.download_button(
-            "📊 SmartPLS Excel (Items Only)",
-            data=excel_spls_bytes,
-            file_name="DataSmartPLS4_items_only_SmartPLS.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-
-        st.download_button(
-            "📘 Codebook (CSV)",
-            data=codebook_csv_bytes,
-            file_name="DataSmartPLS4_codebook.csv",
-            mime="text/csv",
-        )
-
-        st.download_button(
-            "🌐 Codebook (HTML)",
-            data=codebook_html_bytes,
-            file_name="DataSmartPLS4_codebook.html",
-            mime="text/html",
-        )
-
-        if pdf_ok:
-            st.download_button(
-                "📕 Codebook (PDF)",
-                data=pdf_bytes,
-                file_name="DataSmartPLS4_codebook.pdf",
-                mime="application/pdf",
-            )
-        else:
-            st.caption("PDF export unavailable (install `reportlab` to enable).")
-
-        st.download_button(
-            "🧩 Metadata (JSON)",
-            data=metadata_bytes,
-            file_name="DataSmartPLS4_metadata.json",
-            mime="application/json",
-        )
+        _download(bundle, errors, "excel_smartpls", "📊 SmartPLS Excel (Items Only)",
+                  "DataSmartPLS4_items_only_SmartPLS.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        _download(bundle, errors, "codebook_csv", "📘 Codebook (CSV)",
+                  "DataSmartPLS4_codebook.csv", "text/csv")
+        _download(bundle, errors, "codebook_html", "🌐 Codebook (HTML)",
+                  "DataSmartPLS4_codebook.html", "text/html")
+        _download(bundle, errors, "codebook_pdf", "📕 Codebook (PDF)",
+                  "DataSmartPLS4_codebook.pdf", "application/pdf",
+                  "PDF export unavailable (install `fpdf2` or `reportlab` to enable).")
+        _download(bundle, errors, "metadata_json", "🧩 Metadata (JSON)",
+                  "DataSmartPLS4_metadata.json", "application/json")
 
     # -----------------------------
     # Column C — Statistical packages
@@ -192,35 +148,15 @@ def run():
     with colC:
         st.markdown("### Statistical Software")
 
-        if spss_ok:
-            st.download_button(
-                "📁 SPSS (.sav)",
-                data=spss_bytes,
-                file_name="DataSmartPLS4.sav",
-                mime="application/octet-stream",
-            )
-        else:
-            st.caption("SPSS export unavailable (install `pyreadstat`).")
-
-        if stata_ok:
-            st.download_button(
-                "📁 Stata (.dta)",
-                data=stata_bytes,
-                file_name="DataSmartPLS4.dta",
-                mime="application/octet-stream",
-            )
-        else:
-            st.caption("Stata export unavailable (install `pyreadstat`).")
-
-        if rds_ok:
-            st.download_button(
-                "📁 R (.rds)",
-                data=rds_bytes,
-                file_name="DataSmartPLS4.rds",
-                mime="application/octet-stream",
-            )
-        else:
-            st.caption("R export unavailable (install `pyreadr`).")
+        _download(bundle, errors, "spss", "📁 SPSS (.sav)",
+                  "DataSmartPLS4.sav", "application/octet-stream",
+                  "SPSS export unavailable (install `pyreadstat`).")
+        _download(bundle, errors, "stata", "📁 Stata (.dta)",
+                  "DataSmartPLS4.dta", "application/octet-stream",
+                  "Stata export unavailable (install `pyreadstat`).")
+        _download(bundle, errors, "rds", "📁 R (.rds)",
+                  "DataSmartPLS4.rds", "application/octet-stream",
+                  "R export unavailable (install `pyreadr`).")
 
     # ---------- FOOTER ----------
     render_app_footer()
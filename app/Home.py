@@ -8,7 +8,6 @@ from core.config import (
     DemographicConfig,
     BiasConfig,
     StructuralConfig,
-    PathConfig,
 )
 from core.generator import generate_dataset
 from app.branding import render_app_header, render_app_footer
@@ -168,36 +167,14 @@ def run():
 
     structural_cfg = StructuralConfig(paths=[], r2_targets={})
 
-    if "structural_config_raw" in st.session_state:
-        raw = st.session_state["structural_config_raw"]
-
-        paths = []
-        for p in raw.get("paths", []):
-            try:
-                src = str(p.get("source", "")).strip()
-                tgt = str(p.get("target", "")).strip()
-                beta_val = float(p.get("beta", 0.0))
-                if src and tgt:
-                    paths.append(PathConfig(source=src, target=tgt, beta=beta_val))
-            except Exception:
-                continue
-
-        r2_dict = {}
-        for k, v in raw.get("r2_targets", {}).items():
-            try:
-                val = float(v)
-                if val > 0:
-                    r2_dict[str(k)] = val
-            except Exception:
-                continue
-
-        structural_cfg = StructuralConfig(paths=paths, r2_targets=r2_dict)
+    if st.session_state.get("structural_config") is not None:
+        structural_cfg = st.session_state["structural_config"]
 
         st.success(
-            f"Structural model detected: {len(paths)} paths · "
-            f"R² specified for {len(r2_dict)} constructs."
+            f"Structural model detected: {len(structural_cfg.paths)} paths · "
+            f"R² specified for {len(structural_cfg.r2_targets)} constructs."
         )
-        st.json(raw)
+        st.json(structural_cfg.to_dict())
     else:
         st.info(
             "No structural model found. Data will be generated without structural relations."
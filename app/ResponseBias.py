@@ -154,6 +154,15 @@ def run():
         0.0, 0.50, 0.00, step=0.01
     )
 
+    # Default to the seed of the last generated dataset, if any
+    last_cfg = st.session_state.get("last_model_cfg")
+    default_seed = last_cfg.sample.random_seed if last_cfg is not None else 123
+
+    random_seed = st.number_input(
+        "Random seed", min_value=0, max_value=999_999,
+        value=int(default_seed or 0), step=1
+    )
+
     # ------------------------------------------------
     # 4. APPLY BIAS TRANSFORMATIONS
     # ------------------------------------------------
@@ -175,6 +184,7 @@ def run():
                     extreme_bias_level=float(extreme_bias_level),
                     acquiescence_level=float(acquiescence_level),
                     missing_rate=float(missing_rate),
+                    seed=int(random_seed),
                 )
             except Exception as e:
                 st.error(f"Bias application failed: {e}")
@@ -5,6 +5,20 @@ from core.config import PathConfig, StructuralConfig
 from app.branding import render_app_header, render_app_footer
 
 
+# ============================================================
+#  PATH STORE HELPERS
+# ============================================================
+def _paths_frame() -> pd.DataFrame:
+    """Materialize the column-wise path store as a DataFrame (render/save time only)."""
+    return pd.DataFrame(
+        {
+            "source": st.session_state["path_sources"],
+            "target": st.session_state["path_targets"],
+            "beta": st.session_state["path_betas"],
+        }
+    )
+
+
 # ============================================================
 #  PAGE FUNCTION (required for navigation)
 # ============================================================
@@ -85,16 +99,13 @@ def run():
         """
     )
 
-    # Initialize table if missing
-    if "structural_paths_df" not in st.session_state:
-        st.session_state["structural_paths_df"] = pd.DataFrame(
-            {"source": [], "target": [], "beta": []}
-        )
-
-    paths_df = st.session_state["structural_paths_df"]
+    # Initialize column-wise path store if missing
+    for key in ("path_sources", "path_targets", "path_betas"):
+        if key not in st.session_state:
+            st.session_state[key] = []
 
     edited_df = st.data_editor(
-        paths_df,
+        _paths_frame(),
         num_rows="dynamic",
         use_container_width=True,
         key="paths_editor",
@@ -111,7 +122,10 @@ def run():
         },
     )
 
-    st.session_state["structural_paths_df"] = edited_df
+    # Sync table edits back into the path store
+    st.session_state["path_sources"] = edited_df["source"].tolist()
+    st.session_state["path_targets"] = edited_df["target"].tolist()
+    st.session_state["path_betas"] = edited_df["beta"].tolist()
 
     st.markdown("---")
 
@@ -145,15 +159,20 @@ def run():
         if new_source == new_target:
             st.error("Source and target cannot be the same.")
         else:
-            new_row = pd.DataFrame(
-                [{"source": new_source, "target": new_target, "beta": float(new_beta)}]
-            )
-
-            st.session_state["structural_paths_df"] = (
-                pd.concat([st.session_state["structural_paths_df"], new_row], ignore_index=True)
-                .drop_duplicates(subset=["source", "target"], keep="last")
-                .reset_index(drop=True)
-            )
+            srcs = st.session_state["path_sources"]
+            tgts = st.session_state["path_targets"]
+            betas = st.session_state["path_betas"]
+
+            # Overwrite β if the path already exists, otherwise append
+            key = (new_source, new_target)
+            for i, existing in enumerate(zip(srcs, tgts)):
+                if existing == key:
+                    betas[i] = float(new_beta)
+                    break
+            else:
+                srcs.append(new_source)
+                tgts.append(new_target)
+                betas.append(float(new_beta))
 
             st.success(f"Added structural path: {new_source} → {new_target} (β = {new_beta:.2f})")
 
@@ -162,12 +181,7 @@ def run():
     # ============================================================
     st.subheader("3. Optional R² Targets")
 
-    df_paths = st.session_state["structural_paths_df"]
-
-    if not df_paths.empty:
-        endogenous = sorted(set(df_paths["target"].dropna()))
-    else:
-        endogenous = []
+    endogenous = sorted({t for t in st.session_state["path_targets"] if pd.notna(t)})
 
     if endogenous:
         # Initialize if missing
@@ -203,17 +217,16 @@ def run():
 
         paths_cfg = []
 
-        for _, row in st.session_state["structural_paths_df"].iterrows():
-            if pd.isna(row["source"]) or pd.isna(row["target"]):
-                continue
-
-            beta_val = float(row["beta"]) if pd.notna(row["beta"]) else 0.30
+        # Fill missing betas once for the whole column (default β = 0.30)
+        save_df = _paths_frame().dropna(subset=["source", "target"])
+        betas = pd.to_numeric(save_df["beta"], errors="coerce").fillna(0.30).to_numpy(dtype=float)
 
+        for src, tgt, beta_val in zip(save_df["source"], save_df["target"], betas):
             paths_cfg.append(
                 PathConfig(
-                    source=str(row["source"]).strip(),
-                    target=str(row["target"]).strip(),
-                    beta=beta_val,
+                    source=str(src).strip(),
+                    target=str(tgt).strip(),
+                    beta=float(beta_val),
                 )
             )
 
@@ -227,20 +240,14 @@ def run():
             except:
                 continue
 
-        # Save a JSON-serializable version for Home.py
-        st.session_state["structural_config_raw"] = {
-            "paths": [{"source": p.source, "target": p.target, "beta": p.beta} for p in paths_cfg],
-            "r2_targets": r2_targets,
-        }
-
-        # Save compiled config
+        # Save compiled config (Home.py derives the JSON view on demand)
         st.session_state["structural_config"] = StructuralConfig(
             paths=paths_cfg,
             r2_targets=r2_targets,
         )
 
         st.success("Structural model saved successfully.")
-        st.json(st.session_state["structural_config_raw"])
+        st.json(st.session_state["structural_config"].to_dict())
 
     else:
         st.caption("Click **Save** to apply current settings to the Home page.")
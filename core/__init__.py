@@ -1 +1,26 @@
+"""
+core
+----
+Simulation engine for DataSmartPLS 4.0. The configuration dataclasses are
+re-exported here so callers share the single definitions in core/config.py.
+"""
 
+from .config import (
+    BiasConfig,
+    ConstructConfig,
+    DemographicConfig,
+    ModelConfig,
+    PathConfig,
+    SampleConfig,
+    StructuralConfig,
+)
+
+__all__ = [
+    "BiasConfig",
+    "ConstructConfig",
+    "DemographicConfig",
+    "ModelConfig",
+    "PathConfig",
+    "SampleConfig",
+    "StructuralConfig",
+]
@@ -14,160 +14,341 @@ Includes:
 - missingness (MCAR)
 
 All functions are vectorized as much as possible for speed.
+Each stage is a private in-place ndarray kernel (`_*_inplace`); the public
+`apply_*` wrappers copy the frame to an ndarray, run the kernel and wrap
+the result once. Wrappers never mutate their input, and a stage with a
+zero rate returns the input frame unchanged.
 """
 
 from __future__ import annotations
+from typing import Optional
 import numpy as np
 import pandas as pd
 
+from .generator import _likert_dtype
+
+
+# --------------------------------------------------------------
+# 0. SHARED HELPERS
+# --------------------------------------------------------------
+# Process-wide fallback Generator for unseeded calls, created once at import
+# instead of re-seeding from OS entropy on every helper call. NumPy guards the
+# underlying bit generator with a lock, so concurrent Streamlit sessions are
+# safe, but interleaved draws are not reproducible — pass `rng`/`seed` for that.
+_RNG = np.random.default_rng()
+
+
+def _wrap_likert(arr: np.ndarray, like: pd.DataFrame, likert_min: int, likert_max: int) -> pd.DataFrame:
+    """
+    Wrap a float result like `like`; fully observed data goes back to integer
+    codes (int8 when the scale fits, as in the generator).
+    """
+    if np.isfinite(arr).all():
+        arr = arr.astype(_likert_dtype(likert_min, likert_max))
+
+    return pd.DataFrame(arr, index=like.index, columns=like.columns)
+
+
+def _compact_likert(df: pd.DataFrame, likert_min: int, likert_max: int) -> np.ndarray:
+    """
+    Copy responses to integer codes if fully observed integers, else to float32.
+    The code dtype must hold both the data and every scale value a stage may
+    write (int8 for realistic scales).
+    """
+    values = df.to_numpy(dtype=np.float64)
+    finite = np.isfinite(values).all()
+
+    if finite and np.array_equal(values, np.rint(values)):
+        lo = min(values.min(initial=likert_min), likert_min)
+        hi = max(values.max(initial=likert_max), likert_max)
+        return values.astype(_likert_dtype(lo, hi))
+
+    return values.astype(np.float32)
+
+
+def _scale_codes(df: pd.DataFrame, likert_min: int, likert_max: int) -> np.ndarray:
+    """
+    Private working copy of `df` that can hold every scale value: integer
+    frames too narrow for the scale (e.g. int8 codes, 1–200 scale) are widened.
+    """
+    arr = df.to_numpy(copy=True)
+    if arr.dtype.kind in "iu":
+        info = np.iinfo(arr.dtype)
+        if likert_min < info.min or likert_max > info.max:
+            arr = arr.astype(np.promote_types(arr.dtype, _likert_dtype(likert_min, likert_max)))
+    return arr
+
+
+def _check_scale_fits(arr: np.ndarray, likert_min: int, likert_max: int) -> None:
+    """Refuse to write scale draws into an integer buffer that would truncate them."""
+    if arr.dtype.kind in "iu":
+        info = np.iinfo(arr.dtype)
+        if likert_min < info.min or likert_max > info.max:
+            raise ValueError(
+                f"Likert scale {likert_min}–{likert_max} does not fit {arr.dtype} codes."
+            )
+
+
+def _fast_sample_without_replacement(n: int, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw `k` distinct indices from range(n) (unordered)."""
+    if k * 10 >= n:
+        return rng.choice(n, size=k, replace=False)
+
+    # Sparse case: rejection via set update avoids an O(n) permutation
+    seen = set()
+    while len(seen) < k:
+        seen.update(rng.integers(0, n, size=k - len(seen)).tolist())
+
+    return np.fromiter(seen, dtype=np.int64, count=k)
+
+
+def _sample_cells(n: int, k: int, n_cells: int, rng: np.random.Generator):
+    """Draw `n_cells` distinct (row, col) coordinates from an n×k grid."""
+    return np.divmod(_fast_sample_without_replacement(n * k, n_cells, rng), k)
+
 
 # --------------------------------------------------------------
 # 1. CARELESS RESPONSE (cell-level random noise)
 # --------------------------------------------------------------
-def apply_careless(df: pd.DataFrame, rate: float, likert_min: int, likert_max: int) -> pd.DataFrame:
-    if rate <= 0:
-        return df.copy()
+def _careless_inplace(arr: np.ndarray, rate: float, likert_min: int, likert_max: int,
+                      rng: np.random.Generator) -> None:
+    _check_scale_fits(arr, likert_min, likert_max)
+    n, k = arr.shape
+
+    if rate >= 0.5:
+        # Dense case: redraw the whole grid and blend it in through a mask
+        mask = rng.random((n, k)) < rate
+        np.copyto(arr, rng.integers(likert_min, likert_max + 1, size=(n, k)), where=mask,
+                  casting="unsafe")
+        return
 
-    out = df.copy()
-    n, k = out.shape
-    total = n * k
-    n_affect = int(total * rate)
+    n_affect = int(n * k * rate)
 
-    rng = np.random.default_rng()
+    # Distinct random cell coordinates + values, one vectorized draw each
+    rows, cols = _sample_cells(n, k, n_affect, rng)
+    arr[rows, cols] = rng.integers(likert_min, likert_max + 1, size=n_affect)
 
-    # Random cell coordinates
-    rows = rng.integers(0, n, size=n_affect)
-    cols = rng.integers(0, k, size=n_affect)
 
-    # Generate random values in one vectorized step
-    random_values = rng.integers(likert_min, likert_max + 1, size=n_affect)
-    out.values[rows, cols] = random_values
+def apply_careless(
+    df: pd.DataFrame,
+    rate: float,
+    likert_min: int,
+    likert_max: int,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
+    if rate <= 0:
+        return df
 
-    return out
+    # Work on a private ndarray: df.values may be a copy for mixed dtypes,
+    # in which case fancy-indexed writes would be silently lost.
+    arr = _scale_codes(df, likert_min, likert_max)
+    _careless_inplace(arr, rate, likert_min, likert_max, rng or _RNG)
+
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
 
 # --------------------------------------------------------------
 # 2. STRAIGHT-LINING (row-level constant responses)
 # --------------------------------------------------------------
-def apply_straightlining(df: pd.DataFrame, rate: float, likert_min: int, likert_max: int) -> pd.DataFrame:
-    if rate <= 0:
-        return df.copy()
+def _straightlining_inplace(arr: np.ndarray, rate: float, likert_min: int, likert_max: int,
+                            rng: np.random.Generator) -> None:
+    n = arr.shape[0]
+    rows = _fast_sample_without_replacement(n, int(n * rate), rng)
+    _straightline_rows(arr, rows, likert_min, likert_max, rng)
+
 
-    out = df.copy()
-    n = out.shape[0]
+def _straightline_rows(arr: np.ndarray, rows: np.ndarray, likert_min: int, likert_max: int,
+                       rng: np.random.Generator) -> None:
+    _check_scale_fits(arr, likert_min, likert_max)
+    constant_values = rng.integers(likert_min, likert_max + 1, size=len(rows))
 
-    rng = np.random.default_rng()
-    n_people = int(n * rate)
+    # Fill entire rows with their constant value in one broadcast write
+    arr[rows, :] = constant_values[:, None]
 
-    rows = rng.choice(n, size=n_people, replace=False)
-    constant_values = rng.integers(likert_min, likert_max + 1, size=n_people)
 
-    # Fill entire row with its constant value
-    for i, r in enumerate(rows):
-        out.iloc[r, :] = constant_values[i]
+def apply_straightlining(
+    df: pd.DataFrame,
+    rate: float,
+    likert_min: int,
+    likert_max: int,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
+    if rate <= 0:
+        return df
+
+    arr = _scale_codes(df, likert_min, likert_max)
+    _straightlining_inplace(arr, rate, likert_min, likert_max, rng or _RNG)
 
-    return out
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
 
 # --------------------------------------------------------------
 # 3. RANDOM RESPONDING (full random rows)
 # --------------------------------------------------------------
-def apply_random_responding(df: pd.DataFrame, rate: float, likert_min: int, likert_max: int) -> pd.DataFrame:
-    if rate <= 0:
-        return df.copy()
+def _random_responding_inplace(arr: np.ndarray, rate: float, likert_min: int, likert_max: int,
+                               rng: np.random.Generator) -> None:
+    n = arr.shape[0]
+    rows = _fast_sample_without_replacement(n, int(n * rate), rng)
+    _random_rows(arr, rows, likert_min, likert_max, rng)
 
-    out = df.copy()
-    n, k = out.shape
 
-    rng = np.random.default_rng()
-    n_people = int(n * rate)
+def _random_rows(arr: np.ndarray, rows: np.ndarray, likert_min: int, likert_max: int,
+                 rng: np.random.Generator) -> None:
+    _check_scale_fits(arr, likert_min, likert_max)
+    arr[rows, :] = rng.integers(likert_min, likert_max + 1, size=(len(rows), arr.shape[1]))
 
-    rows = rng.choice(n, size=n_people, replace=False)
-    random_matrix = rng.integers(likert_min, likert_max + 1, size=(n_people, k))
 
-    out.values[rows, :] = random_matrix
+def apply_random_responding(
+    df: pd.DataFrame,
+    rate: float,
+    likert_min: int,
+    likert_max: int,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
+    if rate <= 0:
+        return df
+
+    arr = _scale_codes(df, likert_min, likert_max)
+    _random_responding_inplace(arr, rate, likert_min, likert_max, rng or _RNG)
 
-    return out
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
 
 # --------------------------------------------------------------
 # 4. MIDPOINT BIAS (pull values toward central Likert point)
 # --------------------------------------------------------------
+def _midpoint_inplace(arr: np.ndarray, level: float, likert_min: int, likert_max: int) -> None:
+    midpoint = (likert_min + likert_max) / 2
+
+    # x + level * (mid - x)  ==  (1 - level) * x + level * mid.
+    # Expects in-scale input; the update keeps it in scale, so no re-clip.
+    np.multiply(arr, 1 - level, out=arr)
+    arr += level * midpoint
+    np.rint(arr, out=arr)
+
+
 def apply_midpoint_bias(df: pd.DataFrame, level: float, likert_min: int, likert_max: int) -> pd.DataFrame:
     if level <= 0:
-        return df.copy()
+        return df
 
-    out = df.copy()
-    midpoint = (likert_min + likert_max) / 2
-
-    # Vectorized midpoint transformation
-    out = out + level * (midpoint - out)
-    out = out.round().clip(likert_min, likert_max)
+    arr = df.to_numpy(dtype=np.float32, copy=True)
+    np.clip(arr, likert_min, likert_max, out=arr)
+    _midpoint_inplace(arr, level, likert_min, likert_max)
 
-    return out
+    return _wrap_likert(arr, df, likert_min, likert_max)
 
 
 # --------------------------------------------------------------
 # 5. EXTREMITY BIAS (push values to nearest extreme)
 # --------------------------------------------------------------
-def apply_extremity_bias(df: pd.DataFrame, level: float, likert_min: int, likert_max: int) -> pd.DataFrame:
-    if level <= 0:
-        return df.copy()
-
-    out = df.copy().astype(float)
+def _extremity_inplace(arr: np.ndarray, level: float, likert_min: int, likert_max: int) -> None:
     midpoint = (likert_min + likert_max) / 2
 
-    # Create masks
-    upper_mask = out >= midpoint
-    lower_mask = out < midpoint
+    # Move values toward nearest extreme: x + level * (target - x).
+    # Expects in-scale input, like _midpoint_inplace.
+    #   == (1 - level) * x + level * likert_min  [+ level * (max - min) if upper]
+    upper = arr >= midpoint
+    np.multiply(arr, 1 - level, out=arr)
+    arr += level * likert_min
+    np.add(arr, level * (likert_max - likert_min), out=arr, where=upper)
+    np.rint(arr, out=arr)
 
-    # Move values toward nearest extreme
-    out[upper_mask] = out[upper_mask] + level * (likert_max - out[upper_mask])
-    out[lower_mask] = out[lower_mask] + level * (likert_min - out[lower_mask])
+    # Only an over-unit level can overshoot the scale end points
+    if level > 1:
+        np.clip(arr, likert_min, likert_max, out=arr)
 
-    out = out.round().clip(likert_min, likert_max)
 
-    return out
+def apply_extremity_bias(df: pd.DataFrame, level: float, likert_min: int, likert_max: int) -> pd.DataFrame:
+    if level <= 0:
+        return df
+
+    arr = df.to_numpy(dtype=np.float32, copy=True)
+    np.clip(arr, likert_min, likert_max, out=arr)
+    _extremity_inplace(arr, level, likert_min, likert_max)
+
+    return _wrap_likert(arr, df, likert_min, likert_max)
 
 
 # --------------------------------------------------------------
 # 6. ACQUIESCENCE (systematic upward/downward drift)
 # --------------------------------------------------------------
+def _acquiescence_inplace(arr: np.ndarray, level: float, likert_min: int, likert_max: int) -> None:
+    # More realistic: level range [-1, 1] shifts values by up to ±1 point.
+    # The shift is uniform, so it is applied as a whole integer step.
+    shift = int(round(float(np.clip(level, -1, 1))))
+
+    if arr.dtype.kind == "f":
+        np.rint(arr, out=arr)
+    if shift == 0:
+        np.clip(arr, likert_min, likert_max, out=arr)
+        return
+
+    # clip(x + s, lo, hi) == clip(x, lo - s, hi - s) + s — no int8 overflow
+    np.clip(arr, likert_min - shift, likert_max - shift, out=arr)
+    arr += shift
+
+
 def apply_acquiescence(df: pd.DataFrame, level: float, likert_min: int, likert_max: int) -> pd.DataFrame:
     if level == 0:
-        return df.copy()
+        return df
 
-    out = df.copy()
+    arr = df.to_numpy(copy=True)
+    if arr.dtype.kind not in "iuf":
+        arr = arr.astype(np.float32)
+    _acquiescence_inplace(arr, level, likert_min, likert_max)
 
-    # More realistic: level range [-1, 1] shifts values by up to ±1 point
-    shift_amount = np.clip(level, -1, 1)
+    if arr.dtype.kind == "f":
+        return _wrap_likert(arr, df, likert_min, likert_max)
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
-    out = out + shift_amount
-    out = out.round().clip(likert_min, likert_max)
 
-    return out
+# --------------------------------------------------------------
+# 4–6. FUSED CELL-WISE STAGES (single working buffer)
+# --------------------------------------------------------------
+def _fused_cell_biases(
+    arr: np.ndarray,
+    midpoint_bias_level: float,
+    extreme_bias_level: float,
+    acquiescence_level: float,
+    likert_min: int,
+    likert_max: int,
+) -> None:
+    """Midpoint → extremity → acquiescence on one float buffer, in place."""
+    # Clip once up front; the affine stages then only need to round
+    np.clip(arr, likert_min, likert_max, out=arr)
+
+    if midpoint_bias_level > 0:
+        _midpoint_inplace(arr, midpoint_bias_level, likert_min, likert_max)
+    if extreme_bias_level > 0:
+        _extremity_inplace(arr, extreme_bias_level, likert_min, likert_max)
+    if acquiescence_level != 0:
+        _acquiescence_inplace(arr, acquiescence_level, likert_min, likert_max)
 
 
 # --------------------------------------------------------------
 # 7. MISSINGNESS (MCAR)
 # --------------------------------------------------------------
-def apply_missingness(df: pd.DataFrame, rate: float) -> pd.DataFrame:
-    if rate <= 0:
-        return df.copy()
+def _missingness_inplace(arr: np.ndarray, rate: float, rng: np.random.Generator) -> None:
+    n, k = arr.shape
+    n_nan = int(n * k * rate)
 
-    out = df.copy()
-    n, k = out.shape
+    rows, cols = _sample_cells(n, k, n_nan, rng)
+    arr[rows, cols] = np.nan
 
-    rng = np.random.default_rng()
-    total = n * k
-    n_nan = int(total * rate)
 
-    rows = rng.integers(0, n, size=n_nan)
-    cols = rng.integers(0, k, size=n_nan)
+def apply_missingness(
+    df: pd.DataFrame,
+    rate: float,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
+    if rate <= 0:
+        return df
 
-    out.values[rows, cols] = np.nan
+    # Float copy: integer Likert data cannot hold NaN
+    arr = df.to_numpy(dtype=np.float32, copy=True)
+    _missingness_inplace(arr, rate, rng or _RNG)
 
-    return out
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
 
 # --------------------------------------------------------------
@@ -184,19 +365,60 @@ def apply_all_biases(
     extreme_bias_level: float = 0.0,
     acquiescence_level: float = 0.0,
     missing_rate: float = 0.0,
+    seed: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Applies all response behaviours in a fixed, interpretable sequence.
+    Items are processed as integer codes — int8 for realistic scales — or
+    float32 if they contain gaps.
+    A single Generator seeded from `seed` drives every stochastic stage,
+    so identical seeds reproduce identical biased datasets.
     """
-    out = df.copy()
+    # Clean baseline: nothing to simulate, hand the input straight back
+    if not any((careless_rate, straightlining_rate, random_response_rate,
+                midpoint_bias_level, extreme_bias_level, acquiescence_level, missing_rate)):
+        return df
+
+    if straightlining_rate + random_response_rate > 1:
+        raise ValueError("Straightlining and random responding rates must sum to at most 1.")
+
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+
+    # One ndarray round-trip for the whole pipeline
+    arr = _compact_likert(df, likert_min, likert_max)
 
     # Order matters
-    out = apply_careless(out, careless_rate, likert_min, likert_max)
-    out = apply_straightlining(out, straightlining_rate, likert_min, likert_max)
-    out = apply_random_responding(out, random_response_rate, likert_min, likert_max)
-    out = apply_midpoint_bias(out, midpoint_bias_level, likert_min, likert_max)
-    out = apply_extremity_bias(out, extreme_bias_level, likert_min, likert_max)
-    out = apply_acquiescence(out, acquiescence_level, likert_min, likert_max)
-    out = apply_missingness(out, missing_rate)
-
-    return out
+    if careless_rate > 0:
+        _careless_inplace(arr, careless_rate, likert_min, likert_max, rng)
+    if straightlining_rate > 0 and random_response_rate > 0:
+        # One shuffle yields disjoint straight-liner / random-responder sets
+        n = arr.shape[0]
+        n_sl = int(n * straightlining_rate)
+        n_rr = int(n * random_response_rate)
+        perm = rng.permutation(n)
+        _straightline_rows(arr, perm[:n_sl], likert_min, likert_max, rng)
+        _random_rows(arr, perm[n_sl:n_sl + n_rr], likert_min, likert_max, rng)
+    elif straightlining_rate > 0:
+        _straightlining_inplace(arr, straightlining_rate, likert_min, likert_max, rng)
+    elif random_response_rate > 0:
+        _random_responding_inplace(arr, random_response_rate, likert_min, likert_max, rng)
+
+    # Cell-wise affine stages share one float32 buffer
+    if midpoint_bias_level > 0 or extreme_bias_level > 0:
+        arr = arr.astype(np.float32, copy=False)
+        _fused_cell_biases(
+            arr, midpoint_bias_level, extreme_bias_level, acquiescence_level,
+            likert_min, likert_max,
+        )
+        if missing_rate <= 0 and np.isfinite(arr).all():
+            arr = arr.astype(_likert_dtype(likert_min, likert_max))
+
+    # Acquiescence alone is an integer shift — stays on int8 codes
+    elif acquiescence_level != 0:
+        _acquiescence_inplace(arr, acquiescence_level, likert_min, likert_max)
+
+    if missing_rate > 0:
+        arr = arr.astype(np.float32, copy=False)
+        _missingness_inplace(arr, missing_rate, rng)
+
+    return pd.DataFrame(arr, index=df.index, columns=df.columns)
@@ -6,7 +6,8 @@ Enhanced version with deeper validation and safeguards.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from graphlib import CycleError, TopologicalSorter
 from typing import List, Optional, Literal, Dict
 
 
@@ -29,7 +30,7 @@ LikertScaleType = Literal["discrete_likert"]
 # STRUCTURAL MODEL CONFIGURATION
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PathConfig:
     """
     Represents a single structural path:
@@ -40,8 +41,9 @@ class PathConfig:
     beta: float
 
     def __post_init__(self):
-        self.source = str(self.source).strip()
-        self.target = str(self.target).strip()
+        # Frozen: normalise through object.__setattr__
+        object.__setattr__(self, "source", str(self.source).strip())
+        object.__setattr__(self, "target", str(self.target).strip())
 
         if not self.source or not self.target:
             raise ValueError("Structural path cannot have empty source or target.")
@@ -53,7 +55,7 @@ class PathConfig:
             raise ValueError("Beta coefficient must be numeric.")
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuralConfig:
     """Container for structural model settings."""
     paths: List[PathConfig] = field(default_factory=list)
@@ -87,36 +89,33 @@ class StructuralConfig:
         # Detect circular loops
         self._check_cycles()
 
+    # ------------------------
+    def to_dict(self) -> Dict[str, object]:
+        """JSON-serializable view of the structural model (paths + R² targets)."""
+        return {
+            "paths": [{"source": p.source, "target": p.target, "beta": p.beta} for p in self.paths],
+            "r2_targets": dict(self.r2_targets),
+        }
+
     # ------------------------
     def _check_cycles(self):
         """Detect circular dependencies (e.g., PE→EE→PE)."""
-        graph = {}
+        sorter = TopologicalSorter()
         for p in self.paths:
-            graph.setdefault(p.source, []).append(p.target)
-
-        visited = set()
-        stack = set()
+            sorter.add(p.target, p.source)
 
-        def dfs(node):
-            if node in stack:
-                raise ValueError(f"Circular dependency detected involving '{node}'.")
-            if node in visited:
-                return
-            visited.add(node)
-            stack.add(node)
-            for nxt in graph.get(node, []):
-                dfs(nxt)
-            stack.remove(node)
-
-        for node in graph:
-            dfs(node)
+        try:
+            sorter.prepare()
+        except CycleError as exc:
+            node = exc.args[1][0]
+            raise ValueError(f"Circular dependency detected involving '{node}'.") from None
 
 
 # ============================================================
 # MEASUREMENT MODEL CONFIGURATION
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConstructConfig:
     """Defines reflective construct + indicator generation rules."""
     name: str
@@ -137,7 +136,7 @@ class ConstructConfig:
     allow_cross_loadings: bool = False
 
     def __post_init__(self):
-        self.name = str(self.name).strip()
+        object.__setattr__(self, "name", str(self.name).strip())
         if not self.name:
             raise ValueError("Construct name cannot be empty.")
         if self.n_items <= 0:
@@ -165,7 +164,7 @@ class ConstructConfig:
 # SAMPLING CONFIGURATION
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SampleConfig:
     n_respondents: int = 500
     likert_min: int = 1
@@ -184,7 +183,7 @@ class SampleConfig:
 # DEMOGRAPHIC CONFIG
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemographicConfig:
     add_demographics: bool = True
 
@@ -193,7 +192,19 @@ class DemographicConfig:
 # RESPONSE BIAS CONFIG
 # ============================================================
 
-@dataclass
+# Declarative bounds: field → (low, high, error message)
+_BIAS_BOUNDS: Dict[str, tuple] = {
+    "careless_rate": (0.0, 1.0, "Careless rate must be between 0 and 1."),
+    "straightlining_rate": (0.0, 1.0, "Straightlining rate must be between 0 and 1."),
+    "random_response_rate": (0.0, 1.0, "Random responding rate must be between 0 and 1."),
+    "acquiescence_level": (-1.0, 1.0, "Acquiescence must be in [-1, 1]."),
+    "midpoint_bias_level": (0.0, 1.0, "Midpoint bias must be 0–1."),
+    "extreme_bias_level": (0.0, 1.0, "Extreme bias must be 0–1."),
+    "missing_rate": (0.0, 0.5, "Missing-rate must be 0–0.5."),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class BiasConfig:
     careless_rate: float = 0.0
     straightlining_rate: float = 0.0
@@ -204,27 +215,20 @@ class BiasConfig:
     missing_rate: float = 0.0         # 0 to 0.5
 
     def validate(self):
-        if not (0 <= self.careless_rate <= 1):
-            raise ValueError("Careless rate must be between 0 and 1.")
-        if not (0 <= self.straightlining_rate <= 1):
-            raise ValueError("Straightlining rate must be between 0 and 1.")
-        if not (0 <= self.random_response_rate <= 1):
-            raise ValueError("Random responding rate must be between 0 and 1.")
-        if not (-1 <= self.acquiescence_level <= 1):
-            raise ValueError("Acquiescence must be in [-1, 1].")
-        if not (0 <= self.midpoint_bias_level <= 1):
-            raise ValueError("Midpoint bias must be 0–1.")
-        if not (0 <= self.extreme_bias_level <= 1):
-            raise ValueError("Extreme bias must be 0–1.")
-        if not (0 <= self.missing_rate <= 0.5):
-            raise ValueError("Missing-rate must be 0–0.5.")
+        for name, (low, high, message) in _BIAS_BOUNDS.items():
+            if not (low <= getattr(self, name) <= high):
+                raise ValueError(message)
+
+        # Straight-liners and random responders are disjoint respondent sets
+        if self.straightlining_rate + self.random_response_rate > 1:
+            raise ValueError("Straightlining and random responding rates must sum to at most 1.")
 
 
 # ============================================================
 # GLOBAL MODEL CONFIG
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     project_name: str
     researcher_name: str
@@ -267,5 +271,5 @@ class ModelConfig:
             "structural_paths": [(p.source, p.target, p.beta) for p in self.structural.paths],
             "r2_targets": self.structural.r2_targets,
             "demographics_enabled": self.demographics.add_demographics,
-            "bias_settings": self.bias.__dict__,
+            "bias_settings": asdict(self.bias),
         }
@@ -17,6 +17,8 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List
 
+from scipy.linalg.blas import dsyrk
+
 
 # ============================================================
 # HELPER FUNCTIONS
@@ -29,17 +31,41 @@ def _safe_numeric_df(df: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
+def _as_matrix(data) -> np.ndarray:
+    """
+    Float64 (n, k) array for a DataFrame or an already-numeric array.
+    Rows with no observations are dropped, as in _safe_numeric_df.
+    """
+    if isinstance(data, pd.DataFrame):
+        return _safe_numeric_df(data).to_numpy(dtype=np.float64)
+
+    X = np.asarray(data, dtype=np.float64)
+    empty = np.isnan(X).all(axis=1)
+    return X[~empty] if empty.any() else X
+
+
+def _row_means(X: np.ndarray) -> np.ndarray:
+    """Row means skipping NaN (NaN where a row has no observations)."""
+    missing = np.isnan(X)
+    if not missing.any():
+        return X.mean(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.nansum(X, axis=1) / (~missing).sum(axis=1)
+
+
 # ------------------------------------------------------------
 # Cronbach's Alpha
 # ------------------------------------------------------------
-def cronbach_alpha(df: pd.DataFrame) -> float:
-    df = _safe_numeric_df(df)
-    k = df.shape[1]
+def cronbach_alpha(X) -> float:
+    """Alpha for an item block (DataFrame or numeric (n, k) array)."""
+    X = _as_matrix(X)
+    k = X.shape[1]
     if k < 2:
         return np.nan
 
-    item_vars = df.var(axis=0, ddof=1)
-    total_var = df.sum(axis=1).var(ddof=1)
+    item_vars = np.nanvar(X, axis=0, ddof=1)
+    total_var = np.nansum(X, axis=1).var(ddof=1)
 
     if total_var <= 0:
         return np.nan
@@ -51,18 +77,23 @@ def cronbach_alpha(df: pd.DataFrame) -> float:
 # ------------------------------------------------------------
 # Composite Reliability (PLS-style)
 # ------------------------------------------------------------
-def compute_loadings(df: pd.DataFrame) -> np.ndarray:
+def compute_loadings(X) -> np.ndarray:
     """
     More realistic loading estimation:
     Each indicator is correlated with the mean composite score.
+    Accepts a DataFrame or a numeric (n, k) array.
     """
-    df = _safe_numeric_df(df)
-    latent_score = df.mean(axis=1)
+    X = _as_matrix(X)
+    latent_score = _row_means(X)
 
-    loadings = df.apply(lambda col: np.corrcoef(col, latent_score)[0, 1])
-    loadings = loadings.fillna(0).clip(-0.999, 0.999)
+    # Pearson r of every column with the composite in one matrix-vector product
+    Xc = X - X.mean(axis=0)
+    latc = latent_score - latent_score.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        loadings = (Xc.T @ latc) / np.sqrt((Xc * Xc).sum(axis=0) * (latc @ latc))
+    loadings = np.clip(np.nan_to_num(loadings, nan=0.0), -0.999, 0.999)
 
-    return loadings.values
+    return loadings
 
 
 def composite_reliability(loadings: np.ndarray, errors: np.ndarray) -> float:
@@ -106,28 +137,124 @@ def compute_htmt(df_a: pd.DataFrame, df_b: pd.DataFrame,
     df_a_self = _safe_numeric_df(df_a_self)
     df_b_self = _safe_numeric_df(df_b_self)
 
-    het = df_a.corrwith(df_b, axis=0)
-    het = het.abs().replace([np.inf, -np.inf], np.nan).dropna()
+    # Heterotrait block: every indicator of a against every indicator of b
+    df_a, df_b = df_a.align(df_b, join="inner", axis=0)
+    A = df_a.to_numpy(dtype=np.float64)
+    B = df_b.to_numpy(dtype=np.float64)
 
-    if len(het) == 0:
-        return np.nan
+    if np.isnan(A).any() or np.isnan(B).any():
+        het = _item_correlations(np.hstack([A, B]))[:A.shape[1], A.shape[1]:]
+    else:
+        het = (_zscore(A).T @ _zscore(B)) / (A.shape[0] - 1)
+
+    mono_a = _item_correlations(df_a_self.to_numpy(dtype=np.float64))
+    mono_b = _item_correlations(df_b_self.to_numpy(dtype=np.float64))
+
+    return _htmt_ratio(het, _off_diagonal(mono_a), _off_diagonal(mono_b))
 
-    mono_a = df_a_self.corr().abs()
-    mono_b = df_b_self.corr().abs()
 
-    # Off-diagonal average (exclude diagonal=1)
-    def off_diag_mean(m):
-        vals = m.values.flatten()
-        filtered = [v for v in vals if v < 0.9999]  # exclude diagonal
-        return np.mean(filtered) if filtered else np.nan
+def _off_diagonal(m: np.ndarray) -> np.ndarray:
+    """Upper off-diagonal entries of a symmetric correlation matrix."""
+    return m[np.triu_indices_from(m, k=1)]
 
-    mono_a_mean = off_diag_mean(mono_a)
-    mono_b_mean = off_diag_mean(mono_b)
 
-    if mono_a_mean <= 0 or mono_b_mean <= 0:
+def _htmt_ratio(het: np.ndarray, mono_a: np.ndarray, mono_b: np.ndarray) -> float:
+    """
+    HTMT from heterotrait / monotrait correlations. Non-finite entries (e.g.
+    from a zero-variance indicator) are dropped from every mean.
+    """
+    def finite_abs_mean(values):
+        values = np.abs(values[np.isfinite(values)])
+        return values.mean() if values.size else np.nan
+
+    het_mean = finite_abs_mean(het)
+    mono_a_mean = finite_abs_mean(mono_a)
+    mono_b_mean = finite_abs_mean(mono_b)
+
+    if np.isnan(het_mean) or not (mono_a_mean > 0 and mono_b_mean > 0):
         return np.nan
 
-    return float(het.mean() / np.sqrt(mono_a_mean * mono_b_mean))
+    return float(het_mean / np.sqrt(mono_a_mean * mono_b_mean))
+
+
+def _zscore(X: np.ndarray) -> np.ndarray:
+    """Column z-scores (ddof=1); zero-variance columns become NaN."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (X - X.mean(axis=0)) / X.std(axis=0, ddof=1)
+
+
+def _item_correlations(X: np.ndarray) -> np.ndarray:
+    """Item-level Pearson correlation matrix of an (n, p) array."""
+    if np.isnan(X).any():
+        # Pairwise-complete correlations, as DataFrame.corr() computes them
+        return pd.DataFrame(X).corr().to_numpy()
+
+    n, p = X.shape
+    if n < 2 or p == 0:
+        # No sample variance, as DataFrame.corr() reports it (syrk also
+        # rejects an empty operand)
+        return np.full((p, p), np.nan)
+
+    # Symmetric rank-k update: BLAS fills one triangle (half the FLOPs of
+    # Z.T @ Z) and the other is mirrored. Z.T is Fortran-ordered, so no copy.
+    Z = _zscore(X)
+    C = dsyrk(1.0 / (n - 1), Z.T)
+    lower = np.tril_indices_from(C, -1)
+    C[lower] = C.T[lower]
+    return C
+
+
+def htmt_from_C(C: np.ndarray, ia: np.ndarray, ib: np.ndarray) -> float:
+    """
+    HTMT for two indicator blocks, read off a precomputed item correlation
+    matrix C. `ia` / `ib` are the column positions of each block in C.
+    """
+    return _htmt_ratio(
+        C[np.ix_(ia, ib)].ravel(),
+        _off_diagonal(C[np.ix_(ia, ia)]),
+        _off_diagonal(C[np.ix_(ib, ib)]),
+    )
+
+
+def _block_reliability(X: np.ndarray, blocks: List[np.ndarray]):
+    """
+    Alpha, loadings and unit-weight composites for every construct block of a
+    complete (n, p) matrix in one pass: column variances once, composites as
+    X @ W, item–composite correlations as one centred cross-product.
+    """
+    n, p = X.shape
+    K = len(blocks)
+
+    col_var = X.var(axis=0, ddof=1)
+
+    W = np.zeros((p, K))
+    for c, pos in enumerate(blocks):
+        if len(pos):
+            W[pos, c] = 1.0 / len(pos)
+    M = X @ W                                               # (n, K) composites
+    # A construct without indicators has no composite (mean of nothing)
+    M[:, [c for c, pos in enumerate(blocks) if not len(pos)]] = np.nan
+
+    Xc = X - X.mean(axis=0)
+    Mc = M - M.mean(axis=0)
+    m_ss = (Mc * Mc).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R = (Xc.T @ Mc) / np.sqrt(np.outer((Xc * Xc).sum(axis=0), m_ss))
+
+    alphas, loadings = [], []
+    for c, pos in enumerate(blocks):
+        k = len(pos)
+        # Var of the item sum = k² · Var of the mean composite
+        total_var = k * k * m_ss[c] / (n - 1)
+        if k < 2 or total_var <= 0:
+            alphas.append(np.nan)
+        else:
+            alphas.append(float((k / (k - 1)) * (1 - col_var[pos].sum() / total_var)))
+
+        lam = np.nan_to_num(R[pos, c], nan=0.0)
+        loadings.append(np.clip(lam, -0.999, 0.999))
+
+    return alphas, loadings, M
 
 
 # ============================================================
@@ -148,7 +275,16 @@ def compute_measurement_diagnostics(
         dict with alpha, CR, AVE, correlation matrix, HTMT matrix
     """
 
+    # Single numeric conversion; everything below works on NumPy views
     items_df = _safe_numeric_df(items_df)
+    items_np = items_df.to_numpy(dtype=np.float64)
+    col_index = {name: i for i, name in enumerate(items_df.columns)}
+
+    # Column positions of each construct's indicators, resolved once
+    idx = {
+        cons: np.array([col_index[c] for c in indicators], dtype=np.intp)
+        for cons, indicators in construct_map.items()
+    }
 
     results = {
         "alpha": {},
@@ -158,21 +294,42 @@ def compute_measurement_diagnostics(
         "htmt": None,
     }
 
+    constructs = list(construct_map.keys())
     latent_scores = {}
 
+    if not constructs:
+        results["construct_correlations"] = pd.DataFrame(dtype=float)
+        results["htmt"] = pd.DataFrame(dtype=float)
+        return results
+
+    # Indicator columns in use; idx_of maps each block into that sub-matrix
+    used = np.unique(np.concatenate(list(idx.values()))) if idx else np.empty(0, np.intp)
+    X = items_np[:, used]
+    idx_of = {cons: np.searchsorted(used, pos) for cons, pos in idx.items()}
+
     # --------------------------------------------------------
     # Reliability metrics by construct
     # --------------------------------------------------------
-    for cons, indicators in construct_map.items():
-        df_sub = items_df[indicators].copy()
+    complete = not np.isnan(X).any()
+    if complete:
+        alphas, block_loadings, M = _block_reliability(X, [idx_of[c] for c in constructs])
+
+    for c, cons in enumerate(constructs):
+        if complete:
+            results["alpha"][cons] = alphas[c]
+            loadings = block_loadings[c]
+            latent_scores[cons] = M[:, c]
+        else:
+            X_sub = X[:, idx_of[cons]]
 
-        # Cronbach's alpha
-        alpha_val = cronbach_alpha(df_sub)
-        results["alpha"][cons] = alpha_val
+            # Cronbach's alpha
+            results["alpha"][cons] = cronbach_alpha(X_sub)
 
-        # Loadings
-        loadings = compute_loadings(df_sub)
-        loadings = np.nan_to_num(loadings, nan=0.0)
+            # Loadings
+            loadings = np.nan_to_num(compute_loadings(X_sub), nan=0.0)
+
+            # Latent variable score (unit-weight composite)
+            latent_scores[cons] = _row_means(X_sub)
 
         # Measurement error variances
         errors = 1 - (loadings ** 2)
@@ -181,33 +338,30 @@ def compute_measurement_diagnostics(
         results["cr"][cons] = composite_reliability(loadings, errors)
         results["ave"][cons] = ave(loadings)
 
-        # Latent variable score (unit-weight composite)
-        latent_scores[cons] = df_sub.mean(axis=1)
-
     # --------------------------------------------------------
     # Construct-level correlations
     # --------------------------------------------------------
-    latent_df = pd.DataFrame(latent_scores)
-    results["construct_correlations"] = latent_df.corr()
+    results["construct_correlations"] = pd.DataFrame(
+        _item_correlations(np.column_stack(list(latent_scores.values()))),
+        index=list(latent_scores),
+        columns=list(latent_scores),
+    )
 
     # --------------------------------------------------------
     # HTMT Matrix
     # --------------------------------------------------------
-    constructs = list(construct_map.keys())
-    htmt_matrix = pd.DataFrame(index=constructs, columns=constructs, dtype=float)
-
-    for i, a in enumerate(constructs):
-        for j, b in enumerate(constructs):
-            if a == b:
-                htmt_matrix.loc[a, b] = 1.0
-            else:
-                htmt_matrix.loc[a, b] = compute_htmt(
-                    items_df[construct_map[a]],
-                    items_df[construct_map[b]],
-                    items_df[construct_map[a]],
-                    items_df[construct_map[b]],
-                )
-
-    results["htmt"] = htmt_matrix
+    # One item-level correlation matrix over the indicator columns serves
+    # every construct pair
+    C = _item_correlations(X)
+
+    # HTMT is symmetric: compute the upper triangle and mirror it
+    K = len(constructs)
+    H = np.ones((K, K))
+
+    for i in range(K):
+        for j in range(i + 1, K):
+            H[i, j] = H[j, i] = htmt_from_C(C, idx_of[constructs[i]], idx_of[constructs[j]])
+
+    results["htmt"] = pd.DataFrame(H, index=constructs, columns=constructs)
 
     return results
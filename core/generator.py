@@ -13,9 +13,20 @@ This revised version:
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import numpy as np
 import pandas as pd
 
+# Optional lib for Arrow output
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 from .config import (
     ModelConfig,
     ConstructConfig,
@@ -30,109 +41,227 @@ from .structural import simulate_structural_latents
 
 def _sample_loadings(construct: ConstructConfig, rng: np.random.Generator) -> np.ndarray:
     """Generate loadings, centered around target mean, respecting user-defined bounds."""
-    low = construct.target_loading_min
-    high = construct.target_loading_max
+    low, high = construct.target_loading_min, construct.target_loading_max
+    mean, k = construct.target_loading_mean, construct.n_items
 
-    loadings = rng.uniform(low, high, size=construct.n_items)
+    loadings = rng.uniform(low, high, size=k)
 
-    # Center toward target mean
-    shift = construct.target_loading_mean - loadings.mean()
-    loadings = np.clip(loadings + shift, 0.10, 0.99)
+    # Center toward target mean, then clamp once (in place) to the range the
+    # item mixing can use: λ ≤ 0.95 keeps a non-trivial error variance
+    loadings += mean - loadings.mean()
+    np.clip(loadings, 0.10, 0.95, out=loadings)
 
     return loadings
 
 
+@lru_cache(maxsize=256)
+def _cached_loadings(construct: ConstructConfig, entropy: int, spawn_key: Tuple[int, ...]) -> np.ndarray:
+    """
+    Loadings drawn from the construct's own spawned seed stream. Configs are
+    frozen (hashable), so replicate runs with the same seed reuse the draw.
+    The returned array is shared and therefore read-only.
+    """
+    seq = np.random.SeedSequence(entropy, spawn_key=spawn_key)
+    loadings = _sample_loadings(construct, np.random.default_rng(seq))
+    loadings.setflags(write=False)
+    return loadings
+
+
 # ============================================================
 #  REFLECTIVE INDICATOR GENERATION
 # ============================================================
 
-def _likert_discretize(raw, n_cat, lik_min, lik_max):
-    """Safe & stable quantile → Likert binning."""
-    try:
-        # Full quantile binning
-        bins = pd.qcut(raw, n_cat, labels=False, duplicates="drop")
-        if bins.isnull().any():
-            raise ValueError("qcut failed due to low variance.")
-        cats = bins.values
-    except Exception:
-        # Fallback uniform rank transformation
-        ranks = pd.Series(raw).rank(method="average")
-        u = (ranks - 0.5) / len(ranks)
-        cats = np.floor(u * n_cat).astype(int)
-        cats = np.clip(cats, 0, n_cat - 1)
+@lru_cache(maxsize=None)
+def _quantile_probs(n_cat: int) -> np.ndarray:
+    """Interior cut probabilities for n_cat equal-frequency bins (shared, read-only)."""
+    probs = np.linspace(0, 1, n_cat + 1)[1:-1]
+    probs.setflags(write=False)
+    return probs
+
+
+def _quantile_bins(raw, n_cat, out=None):
+    """
+    Equal-frequency category indices (0 .. n_cat-1) for each column of raw,
+    written into `out` (any integer dtype) when given.
+    """
+    n = raw.shape[0]
+
+    # Full quantile binning: category = number of cut points strictly below the
+    # value (side="left" keeps qcut's right-closed bins)
+    q = np.quantile(raw, _quantile_probs(n_cat), axis=0, method="linear")     # (n_cat-1, k)
+
+    cats = np.empty(raw.shape, dtype=np.int8) if out is None else out
+    for j, edges in enumerate(q.T):
+        cats[:, j] = np.searchsorted(edges, raw[:, j], side="left")
+
+    # Fallback equal-count rank binning where cut points collapse (heavy ties)
+    degenerate = np.flatnonzero((np.diff(q, axis=0) <= 0).any(axis=0))
+    if degenerate.size:
+        order = np.argsort(raw[:, degenerate], axis=0, kind="stable")
+        ranks = np.empty_like(order)
+        ranks[order, np.arange(degenerate.size)] = np.arange(n)[:, None]
+        cats[:, degenerate] = (ranks * n_cat) // n
+
+    return cats
+
+
+def _likert_dtype(lik_min, lik_max):
+    """
+    Likert codes fit in one byte for any realistic scale. Both the codes and
+    the category indices 0..n_cat-1 binned before the shift must fit int8.
+    """
+    fits = -128 <= lik_min and lik_max <= 127 and lik_max - lik_min <= 127
+    return np.int8 if fits else np.int64
+
+
+def _likert_discretize(raw, n_cat, lik_min, lik_max, out=None):
+    """
+    Safe & stable quantile → Likert binning, column-wise over an (n, k) matrix.
+    Codes are written into `out` when given (dtype from _likert_dtype).
+    """
+    if out is None:
+        out = np.empty(raw.shape, dtype=_likert_dtype(lik_min, lik_max))
+
+    # Flat columns carry no ordering: detect them up front and use the midpoint
+    flat = np.ptp(raw, axis=0) < 1e-8
+
+    # Category indices go straight into the output buffer, then shift in place
+    if flat.any():
+        out[...] = n_cat // 2
+        live = np.flatnonzero(~flat)
+        if live.size:
+            out[:, live] = _quantile_bins(raw[:, live], n_cat)
+    else:
+        _quantile_bins(raw, n_cat, out=out)
 
-    return (cats + lik_min).clip(lik_min, lik_max)
+    out += lik_min
+    return np.clip(out, lik_min, lik_max, out=out)
 
 
 def _generate_items_for_construct(
     construct: ConstructConfig,
     latent: np.ndarray,
     sample: SampleConfig,
-    rng: np.random.Generator,
-) -> pd.DataFrame:
-    """Generate reflective indicators for a construct."""
-    n = sample.n_respondents
-    lik_min = sample.likert_min
-    lik_max = sample.likert_max
+    rng: Optional[np.random.Generator] = None,
+    loadings: Optional[np.ndarray] = None,
+    eps: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Generate reflective indicators for a construct as an (n, k) code matrix.
+    `eps` may carry pre-drawn standard-normal noise (n, k); it is scaled in place.
+    `out` may be an (n, k) view of a preallocated code matrix to fill.
+    `rng` is only drawn from when `loadings` or `eps` is not supplied.
+    """
+    n, lik_min, lik_max = sample.n_respondents, sample.likert_min, sample.likert_max
     n_cat = lik_max - lik_min + 1
+    r = construct.reverse_items
 
-    loadings = _sample_loadings(construct, rng)
-
-    items = {}
-
-    for idx, lam in enumerate(loadings, start=1):
-        lam = float(np.clip(lam, 0.10, 0.95))
-
-        error_var = max(1e-6, 1.0 - lam * lam)
-        eps = rng.normal(0.0, np.sqrt(error_var), size=n)
+    if loadings is None:
+        loadings = _sample_loadings(construct, rng)
+    k = len(loadings)
 
-        raw = lam * latent + eps
+    # All items at once: raw[:, j] = λ_j · latent + ε_j
+    # (loadings arrive already clamped to [0.10, 0.95] by _sample_loadings)
+    lam = loadings.astype(np.float32)
+    err_sd = np.sqrt(np.maximum(np.float32(1e-6), 1 - lam * lam))
+    if eps is None:
+        eps = rng.standard_normal((n, k))
+    # Build raw in the noise buffer itself: ε·σ_ε in place, then += latent ⊗ λ
+    raw = np.multiply(eps, err_sd[None, :], out=eps)
+    raw += np.multiply.outer(latent, lam)
 
-        lik = _likert_discretize(raw, n_cat, lik_min, lik_max)
-        items[f"{construct.name}_{idx:02d}"] = lik.astype(int)
+    lik = _likert_discretize(raw, n_cat, lik_min, lik_max, out=out)
 
-    df_items = pd.DataFrame(items)
+    # Reverse coding: one subtraction over the leading reverse-keyed block
+    if r > 0:
+        np.subtract(lik_min + lik_max, lik[:, :r], out=lik[:, :r])
 
-    # Reverse coding (safer logic)
-    if construct.reverse_items > 0:
-        cols = df_items.columns[:construct.reverse_items]
-        for c in cols:
-            df_items[c] = lik_min + lik_max - df_items[c]
-
-    return df_items
+    return lik
 
 
 # ============================================================
 #  DEMOGRAPHIC GENERATOR
 # ============================================================
 
-def _generate_demographics(model_cfg: ModelConfig) -> pd.DataFrame:
+# column → (categories, probabilities)
+_DEMOGRAPHICS = {
+    "gender": (["Male", "Female", "Other"], [0.55, 0.43, 0.02]),
+    "age_group": (["18–20", "21–23", "24–26", "27+"], [0.35, 0.40, 0.20, 0.05]),
+    "income_band": (["<15k", "15–30k", "30–50k", ">50k"], [0.40, 0.30, 0.20, 0.10]),
+    "study_level": (
+        ["1st year", "2nd year", "3rd year", "4th year", "Postgrad"],
+        [0.20, 0.25, 0.25, 0.20, 0.10],
+    ),
+}
+
+# Built once at import: column → (categorical dtype, probabilities)
+_DEMOGRAPHIC_CODES = {
+    col: (pd.CategoricalDtype(labels), np.asarray(probs))
+    for col, (labels, probs) in _DEMOGRAPHICS.items()
+}
+
+
+def _generate_demographics(
+    model_cfg: ModelConfig,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
     """Synthetic categorical demographics."""
     if not model_cfg.demographics.add_demographics:
         return pd.DataFrame(index=range(model_cfg.sample.n_respondents))
 
     sample = model_cfg.sample
-    rng = np.random.default_rng(sample.random_seed + 777)
+    if rng is None:
+        rng = np.random.default_rng(sample.random_seed + 777)
 
     n = sample.n_respondents
 
-    return pd.DataFrame({
-        "gender": rng.choice(["Male", "Female", "Other"], n, p=[0.55, 0.43, 0.02]),
-        "age_group": rng.choice(["18–20", "21–23", "24–26", "27+"], n, p=[0.35, 0.40, 0.20, 0.05]),
-        "income_band": rng.choice(["<15k", "15–30k", "30–50k", ">50k"], n, p=[0.40, 0.30, 0.20, 0.10]),
-        "study_level": rng.choice(
-            ["1st year", "2nd year", "3rd year", "4th year", "Postgrad"],
-            n, p=[0.20, 0.25, 0.25, 0.20, 0.10]
-        ),
-    })
+    # Categorical columns: int8 codes plus a small label table per column.
+    # One multinomial draw gives the category counts; a shuffle places them.
+    data = {}
+    for col, (dtype, probs) in _DEMOGRAPHIC_CODES.items():
+        counts = rng.multinomial(n, probs)
+        codes = np.repeat(np.arange(len(probs), dtype=np.int8), counts)
+        rng.shuffle(codes)
+        data[col] = pd.Categorical.from_codes(codes, dtype=dtype)
+
+    return pd.DataFrame(data)
 
 
 # ============================================================
 #  MAIN PIPELINE
 # ============================================================
 
-def generate_dataset(model_cfg: ModelConfig):
-    """Full simulation pipeline: structural → reflective → demographics."""
+def _items_to_arrow(items: np.ndarray, names, demo_df: pd.DataFrame):
+    """
+    Arrow tables straight from the column-major code matrix: each item column is
+    contiguous, so pa.array wraps it without a copy and no pandas blocks are built.
+    """
+    item_cols = [pa.array(items[:, j]) for j in range(items.shape[1])]
+    items_tbl = pa.Table.from_arrays(item_cols, names=list(names))
+
+    if demo_df.empty:
+        return items_tbl, items_tbl
+
+    demo_cols = [
+        pa.DictionaryArray.from_arrays(
+            pa.array(demo_df[col].cat.codes.to_numpy()),
+            pa.array(demo_df[col].cat.categories.astype(str).tolist()),
+        )
+        for col in demo_df.columns
+    ]
+    full_tbl = pa.Table.from_arrays(demo_cols + item_cols, names=list(demo_df.columns) + list(names))
+    return full_tbl, items_tbl
+
+
+def generate_dataset(model_cfg: ModelConfig, return_arrow: bool = False):
+    """
+    Full simulation pipeline: structural → reflective → demographics.
+    With return_arrow=True the (full, items) pair comes back as pyarrow Tables.
+    """
+    if return_arrow and pa is None:
+        raise ImportError("pyarrow not installed (Arrow output unavailable).")
+
     # Validate full model
     model_cfg.validate()
 
@@ -143,14 +272,16 @@ def generate_dataset(model_cfg: ModelConfig):
         raise ValueError("No constructs defined.")
 
     # ----------------------------
-    # RNG for entire process
+    # RNG for entire process: one SeedSequence, independent child streams
+    # for latents, item noise and demographics
     # ----------------------------
-    rng = np.random.default_rng(sample.random_seed)
+    seed_seq = np.random.SeedSequence(sample.random_seed)
+    latent_rng, rng, demo_rng = (np.random.default_rng(s) for s in seed_seq.spawn(3))
 
     # ----------------------------
     # 1. STRUCTURAL LATENT GENERATION
     # ----------------------------
-    latent_df = simulate_structural_latents(model_cfg)
+    latent_df = simulate_structural_latents(model_cfg, rng=latent_rng)
 
     # Enforce ordering based on user-defined constructs
     expected = [c.name for c in constructs]
@@ -159,38 +290,79 @@ def generate_dataset(model_cfg: ModelConfig):
     if missing:
         raise ValueError(f"Missing latent variables in structural output: {missing}")
 
-    latent_scores = {name: latent_df[name].values for name in expected}
+    # Items only need the latents' ranks after mixing: float32 halves the traffic
+    latent_scores = {name: latent_df[name].to_numpy(dtype=np.float32) for name in expected}
 
     # ----------------------------
     # 2. INDICATOR GENERATION
     # ----------------------------
-    item_frames = []
-
-    for cons in constructs:
-        df_items = _generate_items_for_construct(
-            construct=cons,
-            latent=latent_scores[cons.name],
+    total = sum(c.n_items for c in constructs)
+
+    # Column names for every item, built once in construct order
+    item_names = [f"{c.name}_{i:02d}" for c in constructs for i in range(1, c.n_items + 1)]
+
+    # Codes for every construct land in one preallocated (column-major) matrix
+    items = np.empty(
+        (sample.n_respondents, total),
+        dtype=_likert_dtype(sample.likert_min, sample.likert_max),
+        order="F",
+    )
+
+    # One reproducible sub-seed per construct keys the loadings cache
+    loading_seeds = seed_seq.spawn(len(constructs))
+
+    # Item noise for every construct in one draw; each construct gets a column
+    # slice. Drawn item-major and transposed so every item column is contiguous
+    # for the in-place mixing and per-column binning. float32 is ample: only the
+    # within-item ranks survive discretization.
+    noise = rng.standard_normal((total, sample.n_respondents), dtype=np.float32).T
+
+    offsets = np.cumsum([0] + [c.n_items for c in constructs])
+    loadings = [_cached_loadings(c, s.entropy, s.spawn_key) for c, s in zip(constructs, loading_seeds)]
+
+    def build(i):
+        cols = slice(offsets[i], offsets[i + 1])
+        return _generate_items_for_construct(
+            construct=constructs[i],
+            latent=latent_scores[constructs[i].name],
             sample=sample,
-            rng=rng,
+            loadings=loadings[i],
+            eps=noise[:, cols],
+            out=items[:, cols],
         )
-        item_frames.append(df_items)
 
-    items_df = pd.concat(item_frames, axis=1)
+    # Constructs are independent once latents exist, and the NumPy kernels
+    # release the GIL: fill the disjoint column slices concurrently. A single
+    # construct (or a single core) runs inline without spinning up a pool.
+    workers = min(len(constructs), os.cpu_count() or 1)
+    if workers == 1:
+        for i in range(len(constructs)):
+            build(i)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(build, range(len(constructs))))
 
     # ----------------------------
     # 3. DEMOGRAPHICS
     # ----------------------------
-    demo_df = _generate_demographics(model_cfg)
+    demo_df = _generate_demographics(model_cfg, rng=demo_rng)
+
+    if return_arrow:
+        return _items_to_arrow(items, item_names, demo_df)
+
+    # Column-major codes map straight onto pandas' 2-D block: no copy
+    items_df = pd.DataFrame(items, columns=item_names, copy=False)
 
     # ----------------------------
     # 4. FINAL ASSEMBLY
     # ----------------------------
-    if demo_df.empty:
-        full_df = items_df.reset_index(drop=True)
-    else:
-        full_df = pd.concat(
-            [demo_df.reset_index(drop=True), items_df.reset_index(drop=True)],
-            axis=1,
-        )
+    # Both frames carry the same fresh RangeIndex: no reset_index/concat needed.
+    # Deep copy: without copy-on-write, a shared item block would let edits to
+    # one frame show up in the other.
+    full_df = items_df.copy()
+    if not demo_df.empty:
+        # Demographics go in front
+        for pos, col in enumerate(demo_df.columns):
+            full_df.insert(pos, col, demo_df[col].array)
 
     return full_df, items_df
@@ -9,7 +9,10 @@ Fully corrected structural latent generator supporting:
 """
 
 from __future__ import annotations
-from typing import Dict, List, Set, Tuple
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 import numpy as np
 import pandas as pd
 
@@ -21,52 +24,104 @@ from .config import (
     PathConfig,
 )
 
+# Latent scores only feed Likert binning downstream: single precision is ample
+# and halves the memory traffic of every pass
+DTYPE = np.float32
+
 
 # ============================================================
 # EXOGENOUS LATENT GENERATOR
 # ============================================================
 
-def _generate_exogenous_latent(
-    construct: ConstructConfig,
-    sample: SampleConfig,
-    rng: np.random.Generator,
-) -> np.ndarray:
+def _draw_normal(construct: ConstructConfig, n: int, rng: np.random.Generator) -> np.ndarray:
+    return rng.normal(construct.latent_mean, construct.latent_sd, n)
+
 
-    n = sample.n_respondents
+def _draw_uniform(construct: ConstructConfig, n: int, rng: np.random.Generator) -> np.ndarray:
     mean, sd = construct.latent_mean, construct.latent_sd
-    dist = construct.distribution
+    span = np.sqrt(3) * sd
+    return rng.uniform(mean - span, mean + span, n)
 
-    if dist == "normal":
-        latent = rng.normal(mean, sd, n)
 
-    elif dist == "uniform":
-        span = np.sqrt(3) * sd
-        latent = rng.uniform(mean - span, mean + span, n)
+def _draw_lognormal(construct: ConstructConfig, n: int, rng: np.random.Generator) -> np.ndarray:
+    return rng.lognormal(construct.latent_mean, max(construct.latent_sd, 1e-6), n)
 
-    elif dist == "lognormal":
-        latent = rng.lognormal(mean, max(sd, 1e-6), n)
 
-    elif dist == "skewed":
-        base = rng.normal(0, 1, n)
-        skew = np.clip(construct.skew, -2, 2)
+def _rescale_inplace(z: np.ndarray, mean: float, sd: float) -> np.ndarray:
+    """z ← mean + sd · (z − z̄) / (s_z + 1e-8), without temporaries."""
+    np.subtract(z, z.mean(), out=z)
 
-        if skew >= 0:
-            z = np.exp(skew * base)
-        else:
-            z = -np.exp(-skew * base)
+    # Centred in place, so the variance is one BLAS dot (z.std() would
+    # re-centre into a scratch array)
+    scale = sd * np.reciprocal(np.sqrt(np.dot(z, z) / z.size) + 1e-8)
 
-        z = (z - z.mean()) / (z.std() + 1e-8)
-        latent = mean + sd * z
+    np.multiply(z, scale, out=z)
+    if mean:
+        np.add(z, mean, out=z)
+    return z
 
-    elif dist == "beta":
-        x = rng.beta(2, 2, n)
-        z = (x - x.mean()) / (x.std() + 1e-8)
-        latent = mean + sd * z
 
-    else:
-        latent = rng.normal(mean, sd, n)
+def _draw_skewed(construct: ConstructConfig, n: int, rng: np.random.Generator) -> np.ndarray:
+    z = rng.standard_normal(n)
+    skew = min(2.0, max(-2.0, float(construct.skew)))
+
+    # z = sign(skew) · exp(|skew| · base), built in the draw buffer
+    np.multiply(z, abs(skew), out=z)
+    np.exp(z, out=z)
+    if skew < 0:
+        np.negative(z, out=z)
+
+    return _rescale_inplace(z, construct.latent_mean, construct.latent_sd)
+
+
+def _draw_beta(construct: ConstructConfig, n: int, rng: np.random.Generator) -> np.ndarray:
+    return _rescale_inplace(rng.beta(2, 2, n), construct.latent_mean, construct.latent_sd)
+
+
+# distribution name → sampler; unknown names fall back to normal
+_EXOGENOUS_DRAWS = {
+    "normal": _draw_normal,
+    "uniform": _draw_uniform,
+    "lognormal": _draw_lognormal,
+    "skewed": _draw_skewed,
+    "beta": _draw_beta,
+}
+
+
+def _generate_exogenous_latent(
+    construct: ConstructConfig,
+    sample: SampleConfig,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    draw = _EXOGENOUS_DRAWS.get(construct.distribution, _draw_normal)
+    return draw(construct, sample.n_respondents, rng)
+
+
+def _generate_exogenous_block(
+    constructs: List[ConstructConfig],
+    sample: SampleConfig,
+    rng: np.random.Generator,
+    out: np.ndarray,
+    col_idx: Dict[str, int],
+) -> None:
+    """
+    Independent constructs, each from its own stream spawned off `rng`, written
+    into their columns of `out`. Draws release the GIL, so they run concurrently;
+    results do not depend on scheduling.
+    """
+    rngs = rng.spawn(len(constructs))
 
-    return latent
+    def draw(i):
+        c = constructs[i]
+        out[:, col_idx[c.name]] = _generate_exogenous_latent(c, sample, rngs[i])
+
+    workers = min(len(constructs), os.cpu_count() or 1)
+    if workers <= 1:
+        for i in range(len(constructs)):
+            draw(i)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(draw, range(len(constructs))))
 
 
 
@@ -76,64 +131,155 @@ def _generate_exogenous_latent(
 
 def _build_graph(paths: List[PathConfig]):
     parents = {}
-    children = {}
     nodes = set()
 
     for p in paths:
         nodes.add(p.source)
         nodes.add(p.target)
         parents.setdefault(p.target, []).append(p.source)
-        children.setdefault(p.source, []).append(p.target)
 
-    return nodes, parents, children
+    return nodes, parents
 
 
-def _topological_sort(nodes: Set[str], parents: Dict[str, List[str]]):
+def _topological_sort(names: List[str], paths: List[PathConfig]) -> List[str]:
     """
-    Classical Kahn's algorithm for cycle-safe topological sorting.
+    Kahn's algorithm over a CSR adjacency of integer node ids, O(V + E).
+    Nodes are numbered in `names` order and ready nodes leave the queue in
+    that order, so the result (and every draw sequenced by it) does not
+    depend on set or hash ordering.
     """
-    in_deg = {n: 0 for n in nodes}
+    V = len(names)
+    idx = {name: i for i, name in enumerate(names)}
+    src = np.fromiter((idx[p.source] for p in paths), dtype=np.intp, count=len(paths))
+    tgt = np.fromiter((idx[p.target] for p in paths), dtype=np.intp, count=len(paths))
 
-    # compute in-degrees
-    for tgt, srcs in parents.items():
-        for s in srcs:
-            in_deg[tgt] += 1
+    # CSR: children of node u are indices[indptr[u]:indptr[u + 1]]
+    indices = tgt[np.argsort(src, kind="stable")].tolist()
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(src, minlength=V)))).tolist()
+    in_deg = np.bincount(tgt, minlength=V).tolist()
 
     # queue of exogenous constructs
-    queue = [n for n, d in in_deg.items() if d == 0]
+    queue = deque(u for u in range(V) if in_deg[u] == 0)
     order = []
 
     while queue:
-        node = queue.pop(0)
-        order.append(node)
+        u = queue.popleft()
+        order.append(u)
 
         # reduce in-degree of children
-        for tgt, srcs in parents.items():
-            if node in srcs:
-                in_deg[tgt] -= 1
-                if in_deg[tgt] == 0:
-                    queue.append(tgt)
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            in_deg[v] -= 1
+            if in_deg[v] == 0:
+                queue.append(v)
 
-    if len(order) != len(nodes):
+    if len(order) != V:
         raise ValueError("Cycle detected in structural model — PLS-SEM requires a DAG.")
 
-    return order
+    return [names[u] for u in order]
 
 
 
+# ============================================================
+# R² RESOLUTION
+# ============================================================
+
+def _resolve_r2(name: str, beta_vec: np.ndarray, structural: StructuralConfig) -> float:
+    """User R² target for `name`, else the beta-norm heuristic."""
+    r2_targets = structural.r2_targets or {}
+    r2 = float(r2_targets.get(name, 0.0))
+
+    if r2 <= 0:
+        # improved heuristic R²
+        beta_norm = float(np.linalg.norm(beta_vec))
+        r2 = min(0.70, max(0.10, beta_norm / (1 + beta_norm)))
+
+    return r2
+
+
+# ============================================================
+# GAUSSIAN FAST PATH — ONE CHOLESKY DRAW
+# ============================================================
+
+def _simulate_gaussian_latents(
+    order: List[str],
+    structural: StructuralConfig,
+    cons_map: Dict[str, ConstructConfig],
+    sample: SampleConfig,
+    rng: np.random.Generator,
+    out: np.ndarray,
+    col_idx: Dict[str, int],
+) -> np.ndarray:
+    """
+    All-normal models: build the implied correlation matrix of the
+    standardized latents, then draw every construct with one L @ Z.
+    Scores are written into the matching columns of `out` (n, K).
+
+    Each endogenous construct is y = a'x_parents + e with a = √R² · β / sd(β'x),
+    so Var(y) = 1 and the explained share is exactly R², matching the
+    sequential generator in distribution.
+    """
+    K = len(order)
+    pos = {name: i for i, name in enumerate(order)}
+
+    # Path coefficients per target (parents always precede targets in `order`)
+    betas: Dict[str, np.ndarray] = {}
+    raw_betas: Dict[str, List[float]] = {}
+    for p in structural.paths:
+        b = betas.setdefault(p.target, np.zeros(K))
+        b[pos[p.source]] += p.beta
+        raw_betas.setdefault(p.target, []).append(p.beta)
+
+    sigma = np.eye(K)
+
+    for i, name in enumerate(order):
+        if name not in betas:
+            continue
+
+        b = betas[name][:i]
+        lin_var = b @ sigma[:i, :i] @ b
+        if lin_var <= 0:
+            continue
+
+        r2 = _resolve_r2(name, np.array(raw_betas[name]), structural)
+        a = np.sqrt(r2) * b / np.sqrt(lin_var)
+
+        cov = a @ sigma[:i, :i]
+        sigma[i, :i] = cov
+        sigma[:i, i] = cov
+
+    L = np.linalg.cholesky(sigma).astype(DTYPE)
+
+    # Rows of L permuted into output column order: out.T is a C-contiguous
+    # (K, n) view of the column-major matrix, so one GEMM fills every column
+    rows = np.empty(K, dtype=np.intp)
+    for i, name in enumerate(order):
+        rows[col_idx[name]] = i
+    np.matmul(L[rows], rng.standard_normal((K, sample.n_respondents), dtype=DTYPE), out=out.T)
+
+    cols = [order[i] for i in rows]
+    out *= np.fromiter((cons_map[name].latent_sd for name in cols), dtype=DTYPE, count=K)
+    out += np.fromiter((cons_map[name].latent_mean for name in cols), dtype=DTYPE, count=K)
+    return out
+
+
 # ============================================================
 # STRUCTURAL LATENT SIMULATION
 # ============================================================
 
-def simulate_structural_latents(model_cfg: ModelConfig) -> pd.DataFrame:
+def simulate_structural_latents(
+    model_cfg: ModelConfig,
+    rng: Optional[np.random.Generator] = None,
+) -> pd.DataFrame:
     """
     Main structural latent generator.
     Produces a DataFrame of latent variable scores for each construct.
+    `rng` defaults to a generator seeded from the sample config.
     """
 
     sample = model_cfg.sample
     structural = model_cfg.structural
-    rng = np.random.default_rng(sample.random_seed)
+    if rng is None:
+        rng = np.random.default_rng(sample.random_seed)
 
     # ALWAYS treat constructs as a list (generator enforces this)
     constructs: List[ConstructConfig] = model_cfg.constructs
@@ -143,110 +289,140 @@ def simulate_structural_latents(model_cfg: ModelConfig) -> pd.DataFrame:
     if not constructs:
         raise ValueError("No constructs defined in ModelConfig.")
 
+    # Every construct's scores land in one column-major matrix, already in
+    # construct order; the DataFrame wraps it without consolidation
+    col_idx = {name: i for i, name in enumerate(construct_order)}
+    out = np.empty((sample.n_respondents, len(construct_order)), dtype=DTYPE, order="F")
+
     # ============================================================
     # CASE 1 — NO STRUCTURAL RELATIONS
     # ============================================================
     if not structural.paths:
-        return pd.DataFrame({
-            c.name: _generate_exogenous_latent(c, sample, rng)
-            for c in constructs
-        })[construct_order]
+        if all(c.distribution == "normal" for c in constructs):
+            # One draw for every construct: (K, n) transposed is already the
+            # column-major (n, K) layout; scale and shift broadcast per column
+            K = len(constructs)
+            out = rng.standard_normal((K, sample.n_respondents), dtype=DTYPE).T
+            out *= np.fromiter((c.latent_sd for c in constructs), dtype=DTYPE, count=K)
+            out += np.fromiter((c.latent_mean for c in constructs), dtype=DTYPE, count=K)
+        else:
+            _generate_exogenous_block(constructs, sample, rng, out, col_idx)
+        return pd.DataFrame(out, columns=construct_order, copy=False)
 
     # ============================================================
     # CASE 2 — STRUCTURAL MODEL DEFINED
     # ============================================================
-    nodes, parents, children = _build_graph(structural.paths)
+    nodes, parents = _build_graph(structural.paths)
 
     # Validate constructs referenced in structural model
-    for node in nodes:
-        if node not in cons_map:
-            raise ValueError(
-                f"Construct '{node}' is referenced in structural paths "
-                f"but is not defined in ModelConfig."
-            )
+    missing = sorted(nodes - cons_map.keys())
+    if missing:
+        raise ValueError(
+            f"Construct(s) {', '.join(repr(m) for m in missing)} referenced in structural paths "
+            f"but not defined in ModelConfig."
+        )
 
-    # include constructs not referenced at all (pure exogenous)
-    for c in construct_order:
-        nodes.add(c)
+    # every construct is a node: unreferenced ones are pure exogenous
+    order = _topological_sort(list(dict.fromkeys(construct_order)), structural.paths)
 
-    order = _topological_sort(nodes, parents)
+    if all(cons_map[name].distribution == "normal" for name in order):
+        _simulate_gaussian_latents(order, structural, cons_map, sample, rng, out, col_idx)
+        return pd.DataFrame(out, columns=construct_order, copy=False)
 
+    # name → column view of `out`, for parent lookups
     latent_scores = {}
 
+    # (source, beta) per target, gathered in one pass over the paths
+    paths_by_target: Dict[str, List[Tuple[str, float]]] = {}
+    for p in structural.paths:
+        paths_by_target.setdefault(p.target, []).append((p.source, p.beta))
+
     # ============================================================
     # 1. EXOGENOUS GENERATION
     # ============================================================
-    for name in order:
-        if name not in parents or len(parents.get(name, [])) == 0:
-            latent_scores[name] = _generate_exogenous_latent(cons_map[name], sample, rng)
+    exogenous = [name for name in order if not parents.get(name)]
+    _generate_exogenous_block([cons_map[name] for name in exogenous], sample, rng, out, col_idx)
+    for name in exogenous:
+        latent_scores[name] = out[:, col_idx[name]]
 
     # ============================================================
     # 2. ENDOGENOUS GENERATION
     # ============================================================
+    # Structural disturbances for every endogenous construct in one draw
+    endo_names = [name for name in order if name in paths_by_target]
+    eps_mat = rng.standard_normal((len(endo_names), sample.n_respondents), dtype=DTYPE)
+    eps_idx = {name: i for i, name in enumerate(endo_names)}
+
+    # A parent feeding several targets is standardized only once
+    std_cache: Dict[str, np.ndarray] = {}
+
+    def _z(src: str) -> np.ndarray:
+        z = std_cache.get(src)
+        if z is None:
+            z = std_cache[src] = _rescale_inplace(latent_scores[src].copy(), 0.0, 1.0)
+        return z
+
+    # Targets sharing one parent set cannot depend on each other, so their
+    # linear predictors come from a single (g, k) @ (k, n) product
+    groups: Dict[frozenset, List[str]] = {}
+    for name in endo_names:
+        groups.setdefault(frozenset(src for src, _ in paths_by_target[name]), []).append(name)
+    group_of = {name: key for key, members in groups.items() for name in members}
+    ready: Set[str] = set()
+
+    def _predictors(name: str) -> None:
+        """Write B·Z for every target in `name`'s parent-set group into its column."""
+        members = groups[group_of[name]]
+        srcs = list(dict.fromkeys(src for src, _ in paths_by_target[members[0]]))
+        pos = {src: i for i, src in enumerate(srcs)}
+
+        B = np.zeros((len(members), len(srcs)), dtype=DTYPE)
+        for r, tgt in enumerate(members):
+            for src, beta in paths_by_target[tgt]:
+                B[r, pos[src]] += beta
+
+        X = np.stack([_z(src) for src in srcs])
+        if len(members) == 1:
+            np.matmul(B[0], X, out=out[:, col_idx[name]])
+        else:
+            lin = B @ X
+            for r, tgt in enumerate(members):
+                out[:, col_idx[tgt]] = lin[r]
+        ready.update(members)
+
     for name in order:
 
+        # every construct without parents was drawn in the exogenous pass
         if name in latent_scores:
             continue
 
-        if name not in parents:
-            # treat as exogenous
-            latent_scores[name] = _generate_exogenous_latent(cons_map[name], sample, rng)
-            continue
-
-        parent_list = parents[name]
-
-        # Get betas
-        betas = [(p.source, p.beta)
-                 for p in structural.paths
-                 if p.target == name and p.source in parent_list]
-
-        if not betas:
-            latent_scores[name] = _generate_exogenous_latent(cons_map[name], sample, rng)
-            continue
-
-        X = []
-        B = []
-
-        # build predictors
-        for src, beta in betas:
-            parent = latent_scores[src]
-            z = (parent - parent.mean()) / (parent.std() + 1e-8)
-            X.append(z)
-            B.append(beta)
-
-        X = np.vstack(X)
-        B = np.array(B).reshape(-1, 1)
-
-        # linear predictor (standardized)
-        lin = np.dot(B.T, X).flatten()
-        lin = (lin - lin.mean()) / (lin.std() + 1e-8)
+        # Get betas (parents are derived from the same paths)
+        betas = paths_by_target[name]
 
         # R² configuration
-        r2_targets = structural.r2_targets or {}
-        r2 = float(r2_targets.get(name, 0.0))
-
-        if r2 <= 0:
-            # improved heuristic R²
-            beta_vec = np.array([b for _, b in betas])
-            beta_norm = np.sqrt(np.sum(beta_vec ** 2))
-            r2 = float(np.clip(beta_norm / (1 + beta_norm), 0.10, 0.70))
-
-        # error
-        eps = rng.normal(0, 1, sample.n_respondents)
-
-        y_std = np.sqrt(r2) * lin + np.sqrt(1 - r2) * eps
+        B = np.fromiter((b for _, b in betas), dtype=DTYPE, count=len(betas))
+        r2 = _resolve_r2(name, B, structural)
+
+        # linear predictor from cached parent z-scores, in this construct's
+        # column. Parents are centred, so B @ X is too: only scale it to unit
+        # variance (one dot), weighted by √R²
+        if name not in ready:
+            _predictors(name)
+        y = out[:, col_idx[name]]
+        inv_sd = 1.0 / (np.sqrt(np.dot(y, y) / y.size) + 1e-8)
+        y *= np.sqrt(r2) * inv_sd
+
+        # error: scale this construct's disturbance row in place and add
+        eps = eps_mat[eps_idx[name]]
+        eps *= np.sqrt(1 - r2)
+        y += eps
 
         # rescale to construct latent parameters
         cfg = cons_map[name]
-        y_std = (y_std - y_std.mean()) / (y_std.std() + 1e-8)
-        y = cfg.latent_mean + cfg.latent_sd * y_std
-
-        latent_scores[name] = y
+        latent_scores[name] = _rescale_inplace(y, cfg.latent_mean, cfg.latent_sd)
 
     # ============================================================
     # FINAL LATENT DATAFRAME
     # ============================================================
-    df_latent = pd.DataFrame(latent_scores)
-    df_latent = df_latent[construct_order]   # enforce strict order
-
-    return df_latent
+    # Columns of `out` are already in strict construct order
+    return pd.DataFrame(out, columns=construct_order, copy=False)
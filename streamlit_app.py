@@ -13,9 +13,6 @@ st.set_page_config(
 # ============================================================
 # Streamlit Cloud sometimes resets session_state on reload.
 # These lines ensure your structural model is always persistent.
-if "structural_config_raw" not in st.session_state:
-    st.session_state["structural_config_raw"] = {"paths": [], "r2_targets": {}}
-
 if "structural_config" not in st.session_state:
     st.session_state["structural_config"] = None
 
@@ -0,0 +1,11 @@
+import numpy as np
+
+
+# ----------------------------------------------------------
+# Pearson correlation of two clean numeric columns (BLAS path,
+# no pandas NaN-skipping)
+# ----------------------------------------------------------
+def _fast_corr(a, b):
+    a = np.ascontiguousarray(a, dtype=np.float64)
+    b = np.ascontiguousarray(b, dtype=np.float64)
+    return np.corrcoef(a, b)[0, 1]
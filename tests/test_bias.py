@@ -0,0 +1,281 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.config import BiasConfig
+from core.bias import (
+    apply_acquiescence,
+    apply_all_biases,
+    apply_careless,
+    apply_extremity_bias,
+    apply_midpoint_bias,
+    apply_missingness,
+    apply_straightlining,
+)
+
+
+# ----------------------------------------------------------
+# Utility Likert frame factory
+# ----------------------------------------------------------
+def mk_items(n=200, k=6, lo=1, hi=5, seed=1):
+    rng = np.random.default_rng(seed)
+    data = rng.integers(lo, hi + 1, size=(n, k))
+    return pd.DataFrame(data, columns=[f"PE_{i:02d}" for i in range(1, k + 1)])
+
+
+# ----------------------------------------------------------
+# 1. Careless responses must be written back (mixed dtypes)
+# ----------------------------------------------------------
+def test_careless_mixed_dtypes():
+    df = mk_items()
+    df["PE_01"] = df["PE_01"].astype(float)
+
+    out = apply_careless(df, 0.5, 1, 5)
+
+    assert out.shape == df.shape
+    assert (out != df).to_numpy().sum() > 0
+    assert out.min().min() >= 1
+    assert out.max().max() <= 5
+
+
+# ----------------------------------------------------------
+# 2. Missingness on integer Likert data
+# ----------------------------------------------------------
+def test_missingness_on_integer_items():
+    df = mk_items()
+
+    out = apply_missingness(df, 0.10)
+
+    assert out.isna().to_numpy().sum() == int(df.size * 0.10)
+    assert df.isna().to_numpy().sum() == 0  # input untouched
+
+
+# ----------------------------------------------------------
+# 3. Straight-liners answer every item identically
+# ----------------------------------------------------------
+def test_straightlining_rows_are_constant():
+    df = mk_items(n=400)
+
+    out = apply_straightlining(df, 0.25, 1, 5)
+    constant_rows = (out.nunique(axis=1) == 1).sum()
+
+    assert constant_rows >= 100
+
+
+# ----------------------------------------------------------
+# 4. Midpoint / extremity pull values in opposite directions
+# ----------------------------------------------------------
+def test_midpoint_and_extremity_direction():
+    df = mk_items(n=500, lo=1, hi=7)
+    spread = (df - 4).abs().to_numpy().mean()
+
+    mid = apply_midpoint_bias(df, 0.5, 1, 7)
+    ext = apply_extremity_bias(df, 0.5, 1, 7)
+
+    assert (mid - 4).abs().to_numpy().mean() < spread
+    assert (ext - 4).abs().to_numpy().mean() > spread
+    assert mid.min().min() >= 1 and ext.max().max() <= 7
+
+
+def test_midpoint_keeps_missing_values():
+    df = mk_items().astype(float)
+    df.iloc[0, 0] = np.nan
+
+    out = apply_midpoint_bias(df, 0.3, 1, 5)
+
+    assert np.isnan(out.iloc[0, 0])
+
+
+# ----------------------------------------------------------
+# 6. Pipeline works on compact int8 storage
+# ----------------------------------------------------------
+def test_all_biases_compact_dtypes():
+    df = mk_items()
+
+    clean = apply_all_biases(df, 1, 5, careless_rate=0.1, acquiescence_level=0.5)
+    gappy = apply_all_biases(df, 1, 5, careless_rate=0.1, missing_rate=0.1)
+
+    assert (clean.dtypes == np.int8).all()
+    assert (gappy.dtypes == np.float32).all()
+    assert gappy.isna().to_numpy().any()
+
+
+# ----------------------------------------------------------
+# 7. Requested missing rate is realized exactly (no collisions)
+# ----------------------------------------------------------
+@pytest.mark.parametrize("rate", [0.02, 0.40])
+def test_missingness_exact_count(rate):
+    df = mk_items(n=300, k=8)
+
+    out = apply_missingness(df, rate)
+
+    assert out.isna().to_numpy().sum() == int(df.size * rate)
+
+
+# ----------------------------------------------------------
+# 8. Seeded pipeline is reproducible
+# ----------------------------------------------------------
+def test_all_biases_seed_reproducible():
+    df = mk_items()
+    kwargs = dict(careless_rate=0.1, straightlining_rate=0.1, missing_rate=0.05)
+
+    a = apply_all_biases(df, 1, 5, seed=42, **kwargs)
+    b = apply_all_biases(df, 1, 5, seed=42, **kwargs)
+    c = apply_all_biases(df, 1, 5, seed=7, **kwargs)
+
+    pd.testing.assert_frame_equal(a, b)
+    assert not a.equals(c)
+
+
+# ----------------------------------------------------------
+# 9. Fused cell-wise stages match the stage-by-stage result
+# ----------------------------------------------------------
+def test_fused_stages_match_sequential():
+    df = mk_items(lo=1, hi=7)
+
+    fused = apply_all_biases(
+        df, 1, 7,
+        midpoint_bias_level=0.3, extreme_bias_level=0.4, acquiescence_level=0.6,
+    )
+    seq = apply_midpoint_bias(df, 0.3, 1, 7)
+    seq = apply_extremity_bias(seq, 0.4, 1, 7)
+    seq = apply_acquiescence(seq, 0.6, 1, 7)
+
+    pd.testing.assert_frame_equal(fused, seq)
+
+
+# ----------------------------------------------------------
+# 10. Extremity kernel matches the reference formulation
+# ----------------------------------------------------------
+def test_extremity_matches_reference():
+    df = mk_items(lo=1, hi=7)
+    x = df.to_numpy(dtype=float)
+
+    target = np.where(x >= 4, 7, 1)
+    expected = np.clip(np.rint(x + 0.35 * (target - x)), 1, 7)
+
+    out = apply_extremity_bias(df, 0.35, 1, 7)
+
+    np.testing.assert_array_equal(out.to_numpy(), expected)
+
+
+# ----------------------------------------------------------
+# 11. Bias configuration bounds
+# ----------------------------------------------------------
+@pytest.mark.parametrize(
+    "field, value",
+    [("careless_rate", 1.5), ("acquiescence_level", -1.2), ("missing_rate", 0.6)],
+)
+def test_bias_config_rejects_out_of_range(field, value):
+    with pytest.raises(ValueError):
+        BiasConfig(**{field: value}).validate()
+
+    BiasConfig().validate()
+
+
+# ----------------------------------------------------------
+# 12. Acquiescence is a whole-point shift clipped to the scale
+# ----------------------------------------------------------
+def test_acquiescence_integer_shift():
+    df = mk_items(lo=1, hi=5)
+
+    up = apply_acquiescence(df, 0.8, 1, 5)
+    down = apply_all_biases(df, 1, 5, acquiescence_level=-1.0)
+
+    np.testing.assert_array_equal(up.to_numpy(), np.clip(df.to_numpy() + 1, 1, 5))
+    np.testing.assert_array_equal(down.to_numpy(), np.clip(df.to_numpy() - 1, 1, 5))
+    assert (down.dtypes == np.int8).all()
+
+
+# ----------------------------------------------------------
+# 13. Dense careless rates use the masked-blend path
+# ----------------------------------------------------------
+def test_careless_dense_rate():
+    df = mk_items(n=1000, k=10, lo=1, hi=7)
+
+    out = apply_all_biases(df, 1, 7, careless_rate=0.9, seed=3)
+
+    assert out.shape == df.shape
+    assert (out.dtypes == np.int8).all()
+    assert out.min().min() >= 1 and out.max().max() <= 7
+    # ~90% of cells redrawn → only weak agreement with the original
+    assert (out.to_numpy() == df.to_numpy()).mean() < 0.35
+
+
+# ----------------------------------------------------------
+# 14. All-zero settings short-circuit
+# ----------------------------------------------------------
+def test_all_biases_zero_is_noop():
+    df = mk_items()
+
+    assert apply_all_biases(df, 1, 5) is df
+
+
+# ----------------------------------------------------------
+# 15. Straight-liners and random responders are distinct people
+# ----------------------------------------------------------
+def test_straightlining_and_random_rows_disjoint():
+    df = mk_items(n=1000, k=12, lo=1, hi=7)
+
+    out = apply_all_biases(
+        df, 1, 7, straightlining_rate=0.3, random_response_rate=0.3, seed=11
+    )
+    constant_rows = (out.nunique(axis=1) == 1).sum()
+
+    # 300 straight-liners; random rows (12 items) are practically never constant
+    assert 300 <= constant_rows < 310
+
+
+def test_straightlining_plus_random_rate_above_one_is_rejected():
+    df = mk_items()
+
+    with pytest.raises(ValueError, match="sum to at most 1"):
+        BiasConfig(straightlining_rate=0.6, random_response_rate=0.5).validate()
+    with pytest.raises(ValueError, match="sum to at most 1"):
+        apply_all_biases(df, 1, 5, straightlining_rate=0.6, random_response_rate=0.5, seed=1)
+
+    BiasConfig(straightlining_rate=0.5, random_response_rate=0.5).validate()
+
+
+# ----------------------------------------------------------
+# 16. Hybrid sampler returns distinct in-range indices
+# ----------------------------------------------------------
+def test_fast_sample_without_replacement():
+    from core.bias import _fast_sample_without_replacement
+
+    rng = np.random.default_rng(5)
+    for n, k in [(10_000, 30), (10_000, 5_000), (50, 50), (100, 0)]:
+        idx = _fast_sample_without_replacement(n, k, rng)
+        assert len(idx) == k
+        assert len(np.unique(idx)) == k
+        assert k == 0 or (idx.min() >= 0 and idx.max() < n)
+
+
+# ----------------------------------------------------------
+# 17. Wide scales (beyond int8) are not wrapped around
+# ----------------------------------------------------------
+def test_wide_scale_codes_do_not_wrap():
+    df = mk_items(n=300, k=8, lo=1, hi=200, seed=4)
+
+    out = apply_all_biases(df, 1, 200, careless_rate=0.3, random_response_rate=0.2,
+                           extreme_bias_level=0.5, seed=3)
+    shifted = apply_acquiescence(df, 1.0, 1, 200)
+
+    assert out.to_numpy().dtype != np.int8
+    assert out.to_numpy().min() >= 1 and out.to_numpy().max() == 200
+    assert shifted.to_numpy().max() == 200
+    assert (shifted.to_numpy() >= 2).all()
+
+
+def test_careless_widens_narrow_codes_for_wide_scale():
+    from core.bias import _careless_inplace
+
+    df = mk_items(n=200, k=5, lo=1, hi=100, seed=6).astype(np.int8)
+
+    for rate in (0.2, 0.8):
+        out = apply_careless(df, rate, 1, 200, rng=np.random.default_rng(1))
+        assert out.to_numpy().max() > 127
+        assert out.to_numpy().min() >= 1
+
+    with pytest.raises(ValueError, match="does not fit int8"):
+        _careless_inplace(df.to_numpy(copy=True), 0.2, 1, 200, np.random.default_rng(1))
@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.diagnostics import (
+    compute_measurement_diagnostics,
+    cronbach_alpha,
+    compute_loadings,
+    htmt_from_C,
+)
+
+
+def mk_items(n=400, seed=3):
+    """Two correlated constructs (A: 4 items, B: 3 items) on a 1–5 scale."""
+    rng = np.random.default_rng(seed)
+    f = rng.multivariate_normal([0, 0], [[1, 0.5], [0.5, 1]], size=n)
+
+    cols = {}
+    for name, k, fi in [("A", 4, 0), ("B", 3, 1)]:
+        for i in range(k):
+            raw = 0.8 * f[:, fi] + 0.6 * rng.standard_normal(n)
+            cols[f"{name}_{i + 1:02d}"] = np.clip(np.rint(raw + 3), 1, 5)
+
+    items = pd.DataFrame(cols)
+    cmap = {"A": [c for c in items if c.startswith("A_")],
+            "B": [c for c in items if c.startswith("B_")]}
+    return items, cmap
+
+
+def reference_htmt(items, cols_a, cols_b):
+    corr = items[cols_a + cols_b].corr().abs()
+    het = corr.loc[cols_a, cols_b].to_numpy().mean()
+
+    def mono(cols):
+        m = corr.loc[cols, cols].to_numpy()
+        return m[np.triu_indices_from(m, k=1)].mean()
+
+    return het / np.sqrt(mono(cols_a) * mono(cols_b))
+
+
+# ----------------------------------------------------------
+# 1. HTMT matches the textbook definition
+# ----------------------------------------------------------
+def test_htmt_matches_reference():
+    items, cmap = mk_items()
+    res = compute_measurement_diagnostics(items, cmap)
+    htmt = res["htmt"]
+
+    expected = reference_htmt(items, cmap["A"], cmap["B"])
+
+    assert htmt.loc["A", "B"] == pytest.approx(expected)
+    assert htmt.loc["B", "A"] == pytest.approx(expected)
+    assert htmt.loc["A", "A"] == 1.0
+    assert 0 < expected < 1
+
+
+# ----------------------------------------------------------
+# 2. Missing values fall back to pairwise-complete correlations
+# ----------------------------------------------------------
+def test_htmt_with_missing_values():
+    items, cmap = mk_items()
+    items = items.mask(np.random.default_rng(0).random(items.shape) < 0.05)
+
+    res = compute_measurement_diagnostics(items, cmap)
+    expected = reference_htmt(items, cmap["A"], cmap["B"])
+
+    assert res["htmt"].loc["A", "B"] == pytest.approx(expected)
+
+
+# ----------------------------------------------------------
+# 3. Block HTMT on a hand-built correlation matrix
+# ----------------------------------------------------------
+def test_htmt_from_C_blocks():
+    C = np.array([
+        [1.0, 0.6, 0.3, 0.3],
+        [0.6, 1.0, 0.3, 0.3],
+        [0.3, 0.3, 1.0, 0.6],
+        [0.3, 0.3, 0.6, 1.0],
+    ])
+
+    assert htmt_from_C(C, np.array([0, 1]), np.array([2, 3])) == pytest.approx(0.5)
+
+
+def test_htmt_fast_path_matches_compute_htmt_with_constant_item():
+    from core.diagnostics import compute_htmt
+
+    items, cmap = mk_items()
+    items["A_02"] = 3.0
+
+    res = compute_measurement_diagnostics(items, cmap)
+    a, b = items[cmap["A"]], items[cmap["B"]]
+    expected = compute_htmt(a, b, a, b)
+
+    assert np.isfinite(expected)
+    assert res["htmt"].loc["A", "B"] == pytest.approx(expected)
+
+
+# ----------------------------------------------------------
+# 4. Helpers accept frames and arrays interchangeably
+# ----------------------------------------------------------
+def test_helpers_accept_arrays():
+    items, cmap = mk_items()
+    block = items[cmap["A"]]
+
+    assert cronbach_alpha(block.to_numpy()) == pytest.approx(cronbach_alpha(block))
+    np.testing.assert_allclose(compute_loadings(block.to_numpy()), compute_loadings(block))
+
+
+# ----------------------------------------------------------
+# 5. Vectorised loadings match per-item corrcoef
+# ----------------------------------------------------------
+def test_loadings_match_corrcoef():
+    items, cmap = mk_items()
+    X = items[cmap["A"]].to_numpy()
+    composite = X.mean(axis=1)
+
+    expected = [np.corrcoef(X[:, j], composite)[0, 1] for j in range(X.shape[1])]
+
+    np.testing.assert_allclose(compute_loadings(X), expected)
+
+
+# ----------------------------------------------------------
+# 6. Standalone compute_htmt agrees with the matrix path
+# ----------------------------------------------------------
+@pytest.mark.parametrize("missing", [False, True])
+def test_compute_htmt_matches_reference(missing):
+    from core.diagnostics import compute_htmt
+
+    items, cmap = mk_items()
+    if missing:
+        items = items.mask(np.random.default_rng(1).random(items.shape) < 0.05)
+
+    a, b = items[cmap["A"]], items[cmap["B"]]
+
+    assert compute_htmt(a, b, a, b) == pytest.approx(reference_htmt(items, cmap["A"], cmap["B"]))
+
+
+# ----------------------------------------------------------
+# 7. One-pass reliability agrees with the per-construct helpers
+# ----------------------------------------------------------
+def test_one_pass_reliability_matches_helpers():
+    items, cmap = mk_items()
+    res = compute_measurement_diagnostics(items, cmap)
+
+    for cons, cols in cmap.items():
+        lam = compute_loadings(items[cols])
+
+        assert res["alpha"][cons] == pytest.approx(cronbach_alpha(items[cols]))
+        assert res["ave"][cons] == pytest.approx(np.mean(lam ** 2))
+
+
+# ----------------------------------------------------------
+# 8. syrk correlations match DataFrame.corr (constant column → NaN)
+# ----------------------------------------------------------
+def test_item_correlations_match_pandas():
+    from core.diagnostics import _item_correlations
+
+    items, cmap = mk_items()
+    X = items.to_numpy(dtype=np.float64)
+    X[:, 2] = 3.0
+
+    np.testing.assert_allclose(_item_correlations(X), pd.DataFrame(X).corr().to_numpy())
+
+    res = compute_measurement_diagnostics(items, cmap)
+    scores = pd.DataFrame({c: items[cols].mean(axis=1) for c, cols in cmap.items()})
+    pd.testing.assert_frame_equal(res["construct_correlations"], scores.corr())
+
+
+def test_single_respondent_correlations_are_nan():
+    from core.diagnostics import _item_correlations
+
+    items, cmap = mk_items()
+    res = compute_measurement_diagnostics(items.iloc[:1], cmap)
+
+    assert np.isnan(_item_correlations(items.iloc[:1].to_numpy(dtype=np.float64))).all()
+    assert res["construct_correlations"].isna().all().all()
+
+
+# ----------------------------------------------------------
+# 9. Empty construct maps and indicator-less constructs
+# ----------------------------------------------------------
+def test_empty_construct_map_returns_empty_frames():
+    items, cmap = mk_items()
+
+    res = compute_measurement_diagnostics(items, {})
+
+    assert res["alpha"] == {} and res["cr"] == {} and res["ave"] == {}
+    assert res["construct_correlations"].empty
+    assert res["htmt"].empty
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("missing", [False, True])
+def test_construct_without_indicators_is_nan(missing):
+    items, cmap = mk_items()
+    if missing:
+        items = items.mask(np.random.default_rng(1).random(items.shape) < 0.05)
+
+    only_empty = compute_measurement_diagnostics(items, {"A": []})
+    res = compute_measurement_diagnostics(items, {"A": [], "B": cmap["B"]})
+
+    assert np.isnan(only_empty["alpha"]["A"])
+    assert np.isnan(res["cr"]["A"]) and np.isfinite(res["alpha"]["B"])
+    assert np.isnan(res["htmt"].loc["A", "B"])
+    assert np.isnan(res["construct_correlations"].loc["A", "B"])
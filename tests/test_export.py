@@ -0,0 +1,365 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.config import (
+    ConstructConfig,
+    SampleConfig,
+    ModelConfig,
+    DemographicConfig,
+    StructuralConfig,
+    PathConfig,
+)
+from core.generator import generate_dataset
+from utils.export import generate_codebook
+
+
+# ----------------------------------------------------------
+# Utility model factory
+# ----------------------------------------------------------
+def mk_construct(name, items=3, dist="normal"):
+    return ConstructConfig(
+        name=name,
+        n_items=items,
+        latent_mean=0.0,
+        latent_sd=1.0,
+        distribution=dist,
+        target_loading_mean=0.75,
+        target_loading_min=0.60,
+        target_loading_max=0.90,
+    )
+
+
+def mk_model(demographics=True, paths=True):
+    return ModelConfig(
+        project_name="Export",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 3, "skewed"), mk_construct("BI", 4)],
+        sample=SampleConfig(n_respondents=60, random_seed=4),
+        demographics=DemographicConfig(add_demographics=demographics),
+        structural=StructuralConfig(
+            paths=[PathConfig("PE", "BI", 0.4)] if paths else [],
+        ),
+    )
+
+
+# ----------------------------------------------------------
+# 1. Codebook sections, order and empty fields
+# ----------------------------------------------------------
+def test_codebook_sections():
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+
+    cb = generate_codebook(model, items_df, full_df)
+
+    assert cb["variable"].tolist() == (
+        list(items_df.columns)
+        + ["gender", "age_group", "income_band", "study_level", "PE → BI"]
+    )
+    assert cb["construct"].tolist()[:7] == ["PE"] * 3 + ["BI"] * 4
+    assert cb["item_label"].iloc[3] == "Item 1"
+    assert cb.loc[cb["construct"] == "PE", "distribution"].eq("skewed").all()
+    assert cb["scale_max"].iloc[0] == 5
+    assert cb["scale_min"].iloc[7:].isna().all()
+    assert cb["distribution"].iloc[-1] is None
+    assert cb["item_label"].iloc[-1] == "β = 0.400"
+
+
+def test_codebook_items_only_keeps_integer_scale():
+    model = mk_model(demographics=False, paths=False)
+    full_df, items_df = generate_dataset(model)
+
+    cb = generate_codebook(model, items_df, full_df)
+
+    assert len(cb) == items_df.shape[1]
+    assert cb["scale_min"].dtype == np.int64
+    assert (cb["type"] == "Likert item").all()
+
+
+# ----------------------------------------------------------
+# 2. Codebook cache: reused across calls, isolated per caller
+# ----------------------------------------------------------
+def test_codebook_is_cached_and_isolated():
+    from utils.export import _cached_codebook
+
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+
+    first = generate_codebook(model, items_df, full_df)
+    hits = _cached_codebook.cache_info().hits
+    first.loc[0, "variable"] = "edited"
+
+    second = generate_codebook(model, items_df, full_df)
+
+    assert _cached_codebook.cache_info().hits == hits + 1
+    assert second.loc[0, "variable"] == "PE_01"
+
+
+# ----------------------------------------------------------
+# 3. Excel exports round-trip (blank cells for missing values)
+# ----------------------------------------------------------
+def test_excel_export_round_trip():
+    from utils.export import export_excel_full
+
+    model = mk_model(paths=False)
+    full_df, _ = generate_dataset(model)
+    full_df = full_df.astype({"PE_01": float})
+    full_df.loc[[2, 5], "PE_01"] = np.nan
+
+    back = pd.read_excel(BytesIO(export_excel_full(full_df)))
+
+    assert list(back.columns) == list(full_df.columns)
+    assert back["gender"].tolist() == full_df["gender"].astype(str).tolist()
+    np.testing.assert_array_equal(back["BI_02"].to_numpy(), full_df["BI_02"].to_numpy())
+    assert back["PE_01"].isna().sum() == 2
+
+
+# ----------------------------------------------------------
+# 4. CSV export matches pandas' to_csv byte for byte
+# ----------------------------------------------------------
+def _pandas_csv(df):
+    buf = BytesIO()
+    df.to_csv(buf, index=False, lineterminator="\n")
+    return buf.getvalue()
+
+
+def test_csv_export_round_trip():
+    from utils.export import export_csv
+
+    model = mk_model(paths=False)
+    full_df, _ = generate_dataset(model)
+
+    data = export_csv(full_df)
+    back = pd.read_csv(BytesIO(data))
+
+    assert data == _pandas_csv(full_df)
+    assert list(back.columns) == list(full_df.columns)
+    assert back["income_band"].tolist() == full_df["income_band"].astype(str).tolist()
+    np.testing.assert_array_equal(back["PE_03"].to_numpy(), full_df["PE_03"].to_numpy())
+
+
+def test_csv_export_float_items_match_pandas():
+    from utils.export import export_csv
+
+    model = mk_model(paths=False)
+    full_df, _ = generate_dataset(model)
+    full_df = full_df.astype({"PE_01": np.float32, "BI_02": float})
+    full_df.loc[[1, 4], "PE_01"] = np.nan
+
+    assert export_csv(full_df) == _pandas_csv(full_df)
+
+
+# ----------------------------------------------------------
+# 5. Wide integer items are narrowed to one byte before export
+# ----------------------------------------------------------
+def test_narrow_items_downcasts_integer_columns():
+    from utils.export import _narrow_items
+
+    df = pd.DataFrame({
+        "PE_01": np.array([1, 5, 3], dtype=np.int64),
+        "PE_02": np.array([-3, 3, 0], dtype=np.int32),
+        "PE_03": np.array([1.0, np.nan, 2.0]),
+        "gender": pd.Categorical(["Male", "Female", "Other"]),
+    })
+
+    out = _narrow_items(df)
+
+    assert out["PE_01"].dtype == np.uint8
+    assert out["PE_02"].dtype == np.int8
+    assert out["PE_03"].dtype == np.float64
+    assert df["PE_01"].dtype == np.int64
+
+    items = df[["PE_02"]].astype(np.int8)
+    assert _narrow_items(items) is items
+
+
+# ----------------------------------------------------------
+# 6. Export bundle: concurrent exporters, optional formats skipped
+# ----------------------------------------------------------
+def test_export_bundle(monkeypatch):
+    import utils.export as export
+
+    monkeypatch.setattr(export, "pyreadstat", None)
+
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+
+    bundle, errors = export.export_bundle(model, items_df, full_df, ["csv", "codebook_csv", "spss"])
+
+    assert set(bundle) == {"csv", "codebook_csv"}
+    assert errors == {}
+    assert bundle["csv"] == export.export_csv(full_df)
+    assert bundle["codebook_csv"].startswith(b"variable,construct")
+
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export.export_bundle(model, items_df, full_df, ["parquet"])
+
+
+def test_export_bundle_reports_failing_exporter(monkeypatch):
+    import utils.export as export
+
+    def broken(cfg, items, full, cb):
+        raise RuntimeError("layout failed")
+
+    monkeypatch.setitem(export._EXPORTERS, "codebook_html", broken)
+
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+
+    bundle, errors = export.export_bundle(
+        model, items_df, full_df, ["csv", "codebook_html", "metadata_json"]
+    )
+
+    assert set(bundle) == {"csv", "metadata_json"}
+    assert list(errors) == ["codebook_html"]
+    assert isinstance(errors["codebook_html"], RuntimeError)
+
+
+# ----------------------------------------------------------
+# 7. Metadata JSON is valid JSON (empty codebook fields as null)
+# ----------------------------------------------------------
+def test_metadata_json_codebook_records():
+    import json
+
+    from utils.export import export_metadata_json
+
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+    cb = generate_codebook(model, items_df, full_df)
+
+    meta = json.loads(export_metadata_json(model, cb))
+
+    assert len(meta["codebook"]) == len(cb)
+    assert meta["codebook"][0]["variable"] == "PE_01"
+    assert meta["codebook"][0]["scale_max"] == 5
+    assert meta["codebook"][-1]["latent_mean"] is None
+    assert meta["structural_paths"] == [{"source": "PE", "target": "BI", "beta": 0.4}]
+
+def test_metadata_json_orjson_matches_stdlib(monkeypatch):
+    pytest.importorskip("orjson")
+    import json
+
+    import utils.export as export
+
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+    cb = generate_codebook(model, items_df, full_df)
+
+    fast = export.export_metadata_json(model, cb)
+    monkeypatch.setattr(export, "orjson", None)
+    plain = export.export_metadata_json(model, cb)
+
+    assert fast != plain
+    assert json.loads(fast) == json.loads(plain)
+
+
+# ----------------------------------------------------------
+# 8. PDF table cells are formatted column-wise
+# ----------------------------------------------------------
+def test_table_cells_format_columns():
+    from utils.export import _table_cells
+
+    df = pd.DataFrame({
+        "variable": ["PE_01", "gender"],
+        "latent_mean": [0.25, np.nan],
+        "scale_max": [5, 7],
+        "distribution": ["normal", None],
+    })
+
+    assert _table_cells(df) == [
+        ["PE_01", "0.25", "5", "normal"],
+        ["gender", "nan", "7", "None"],
+    ]
+    assert _table_cells(df.iloc[:0]) == []
+
+
+# ----------------------------------------------------------
+# 9. fpdf2 text is reduced to Latin-1 core-font glyphs
+# ----------------------------------------------------------
+def test_pdf_text_latin1():
+    from utils.export import _pdf_text
+
+    assert _pdf_text("PE → BI") == "PE -> BI"
+    assert _pdf_text("β = 0.400") == "beta = 0.400"
+    assert _pdf_text("α") == "?"
+    assert _pdf_text(0.5) == "0.5"
+
+
+# ----------------------------------------------------------
+# 10. Token-table CSV writer matches pandas byte for byte
+# ----------------------------------------------------------
+def test_tokenized_csv_matches_pandas():
+    from utils.export import _csv_bytes_tokenized
+
+    df = pd.DataFrame({
+        "PE_01": np.array([1, 5, 3, 7], dtype=np.int8),
+        "rev": np.array([-3, 12, 0, 9], dtype=np.int8),
+        "age_group": pd.Categorical(["18–20", 'a,"b"', None, "18–20"]),
+        "BI, 1": np.array([2, 2, 2, 2], dtype=np.uint8),
+    })
+    buf = BytesIO()
+    df.to_csv(buf, index=False, lineterminator="\n")
+
+    assert _csv_bytes_tokenized(df) == buf.getvalue()
+    assert _csv_bytes_tokenized(df.assign(score=0.5)) is None
+    assert _csv_bytes_tokenized(df.iloc[:0]) is None
+
+
+# ----------------------------------------------------------
+# 11. SmartPLS sheet: integer cells, styled header row
+# ----------------------------------------------------------
+def test_excel_smartpls_integer_cells():
+    from openpyxl import load_workbook
+
+    from utils.export import export_excel_smartpls
+
+    model = mk_model(demographics=False, paths=False)
+    _, items_df = generate_dataset(model)
+
+    data = export_excel_smartpls(items_df)
+    back = pd.read_excel(BytesIO(data))
+    ws = load_workbook(BytesIO(data)).active
+
+    assert (back.dtypes == np.int64).all()
+    np.testing.assert_array_equal(back.to_numpy(), items_df.to_numpy())
+    assert ws["A1"].value == "PE_01" and ws["A1"].font.b
+    assert isinstance(ws["B2"].value, int)
+
+
+# ----------------------------------------------------------
+# 12. fpdf2 codebook: content-sized columns, no cell overflow
+# ----------------------------------------------------------
+def test_pdf_column_widths_follow_content():
+    from utils.export import _pdf_column_widths
+
+    texts = np.array([["variable", "type"], ["PE_01", "x" * 120]])
+    widths = _pdf_column_widths(texts, 100.0)
+
+    assert widths.sum() == pytest.approx(100.0)
+    assert widths[1] == pytest.approx(100.0 * 40 / 48)
+
+
+def test_fpdf_codebook_cells_fit(monkeypatch):
+    fpdf = pytest.importorskip("fpdf")
+    import utils.export as export
+
+    overflow = []
+
+    class RecordingFPDF(fpdf.FPDF):
+        def cell(self, w=None, h=None, text="", *args, **kwargs):
+            if w and self.get_string_width(text) > w - 2 * self.c_margin + 1e-6:
+                overflow.append(text)
+            return super().cell(w, h, text, *args, **kwargs)
+
+    monkeypatch.setattr(export, "FPDF", RecordingFPDF)
+
+    model = mk_model()
+    full_df, items_df = generate_dataset(model)
+    cb = generate_codebook(model, items_df, full_df)
+    cb.loc[0, "item_label"] = "A very long indicator wording " * 6
+
+    assert export.export_codebook_pdf(cb).startswith(b"%PDF")
+    assert overflow == []
+
@@ -13,6 +13,8 @@ from core.config import (
 )
 from core.generator import generate_dataset
 
+from _helpers import _fast_corr
+
 
 def mk_construct(name, items=4):
     return ConstructConfig(
@@ -122,5 +124,302 @@ def test_reverse_coded_items():
     assert items_df.iloc[:, -1].min() >= 1
 
     # Reverse relationship: high latent -> low observed
-    corr = items_df.iloc[:, -1].corr(items_df.iloc[:, 0])
+    corr = _fast_corr(items_df.iloc[:, -1], items_df.iloc[:, 0])
     assert corr < 0  # must be negative
+
+
+# ----------------------------------------------------------
+# 4. Slotted configs still describe themselves
+# ----------------------------------------------------------
+def test_model_describe_with_slotted_configs():
+    model = ModelConfig(
+        project_name="Describe",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE")],
+        bias=BiasConfig(careless_rate=0.1),
+    )
+
+    desc = model.describe()
+
+    assert not hasattr(model.sample, "__dict__")
+    assert desc["bias_settings"]["careless_rate"] == 0.1
+    assert desc["constructs"] == ["PE"]
+
+
+def test_model_describe_reflects_later_edits():
+    from dataclasses import fields
+
+    model = ModelConfig(
+        project_name="Describe",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE")],
+    )
+    model.describe()
+
+    model.constructs.append(mk_construct("EE"))
+    model.bias = BiasConfig(careless_rate=0.2)
+
+    desc = model.describe()
+    assert desc["constructs"] == ["PE", "EE"]
+    assert desc["bias_settings"]["careless_rate"] == 0.2
+    assert all(not f.name.startswith("_") for f in fields(model))
+
+
+# ----------------------------------------------------------
+# 5. Matrix binning agrees with per-column pd.qcut
+# ----------------------------------------------------------
+def test_likert_discretize_matches_qcut():
+    from core.generator import _likert_discretize
+
+    raw = np.random.default_rng(9).standard_normal((300, 4))
+    lik = _likert_discretize(raw, 5, 1, 5)
+
+    for j in range(raw.shape[1]):
+        expected = pd.qcut(raw[:, j], 5, labels=False) + 1
+        np.testing.assert_array_equal(lik[:, j], expected)
+
+
+def test_likert_discretize_fills_wide_column_major_buffer():
+    from core.generator import _likert_discretize
+
+    raw = np.random.default_rng(21).standard_normal((250, 3))
+    out = np.empty((250, 5), dtype=np.int64, order="F")
+
+    lik = _likert_discretize(raw, 7, -3, 3, out=out[:, 1:4])
+
+    assert np.shares_memory(lik, out)
+    for j in range(raw.shape[1]):
+        expected = pd.qcut(raw[:, j], 7, labels=False) - 3
+        np.testing.assert_array_equal(out[:, j + 1], expected)
+
+def test_likert_dtype_covers_category_indices():
+    from core.generator import _likert_discretize, _likert_dtype
+
+    assert _likert_dtype(1, 7) == np.int8
+    assert _likert_dtype(-100, 100) == np.int64
+
+    raw = np.random.default_rng(4).standard_normal((402, 2))
+    lik = _likert_discretize(raw, 201, -100, 100)
+
+    assert lik.dtype == np.int64
+    np.testing.assert_array_equal(lik[:, 0], pd.qcut(raw[:, 0], 201, labels=False) - 100)
+
+
+def test_likert_discretize_low_variance_fallback():
+    from core.generator import _likert_discretize
+
+    rng = np.random.default_rng(2)
+    tied = np.where(rng.random(100) < 0.6, 0.0, rng.standard_normal(100))
+    raw = np.column_stack([np.zeros(100), tied, rng.standard_normal(100)])
+    lik = _likert_discretize(raw, 5, 1, 5)
+
+    # Flat column sits on the scale midpoint
+    assert (lik[:, 0] == 3).all()
+
+    # Heavily tied column still spreads into equal-count categories
+    assert np.bincount(lik[:, 1])[1:].tolist() == [20] * 5
+
+
+def test_demographics_follow_category_weights():
+    from core.generator import _generate_demographics
+
+    model = ModelConfig(
+        project_name="Demo",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE")],
+        sample=SampleConfig(n_respondents=20000, random_seed=4),
+        demographics=DemographicConfig(add_demographics=True),
+    )
+
+    demo = _generate_demographics(model)
+    share = demo["gender"].value_counts(normalize=True)
+
+    assert list(demo.columns) == ["gender", "age_group", "income_band", "study_level"]
+    assert abs(share["Male"] - 0.55) < 0.02
+    assert abs(share["Other"] - 0.02) < 0.01
+
+
+def test_scalar_configs_are_frozen_and_hashable():
+    import dataclasses
+
+    c = ConstructConfig(name="  PE ", n_items=3)
+
+    assert c.name == "PE"
+    assert hash(c) == hash(ConstructConfig(name="PE", n_items=3))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        c.n_items = 5
+
+
+def test_core_reexports_canonical_configs():
+    import core
+    import core.config
+
+    assert core.ModelConfig is core.config.ModelConfig
+    assert core.ConstructConfig is ConstructConfig
+
+
+def test_items_are_stored_as_int8():
+    model = ModelConfig(
+        project_name="Dtype",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 4)],
+        sample=SampleConfig(n_respondents=200, likert_min=1, likert_max=7),
+    )
+
+    _, items_df = generate_dataset(model)
+
+    assert (items_df.dtypes == np.int8).all()
+    assert items_df.min().min() >= 1 and items_df.max().max() <= 7
+
+
+def test_loadings_cached_across_replicate_runs():
+    from core.generator import _cached_loadings
+
+    model = ModelConfig(
+        project_name="Cache",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 4), mk_construct("EE", 3)],
+        sample=SampleConfig(n_respondents=100, random_seed=31),
+    )
+
+    _, first = generate_dataset(model)
+    hits = _cached_loadings.cache_info().hits
+    _, second = generate_dataset(model)
+
+    assert _cached_loadings.cache_info().hits == hits + 2
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_demographics_are_categorical():
+    model = ModelConfig(
+        project_name="Demo",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE")],
+        sample=SampleConfig(n_respondents=300),
+        demographics=DemographicConfig(add_demographics=True),
+    )
+
+    full_df, _ = generate_dataset(model)
+
+    assert isinstance(full_df["gender"].dtype, pd.CategoricalDtype)
+    assert full_df["gender"].cat.codes.dtype == np.int8
+    assert list(full_df["gender"].cat.categories) == ["Male", "Female", "Other"]
+
+
+def test_threaded_generation_is_reproducible():
+    model = ModelConfig(
+        project_name="Threads",
+        researcher_name="Tester",
+        constructs=[mk_construct(f"C{i}", 5) for i in range(6)],
+        sample=SampleConfig(n_respondents=400, random_seed=8),
+    )
+
+    _, first = generate_dataset(model)
+    _, second = generate_dataset(model)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert list(first.columns[:2]) == ["C0_01", "C0_02"]
+
+
+def test_rank_fallback_handles_several_tied_columns():
+    from core.generator import _quantile_bins
+
+    rng = np.random.default_rng(12)
+    tied = np.where(rng.random((210, 3)) < 0.7, 0.0, rng.standard_normal((210, 3)))
+
+    cats = _quantile_bins(tied, 7)
+
+    # Ordinal argsort ranks give exact equal-count bins in every column
+    for j in range(3):
+        assert np.bincount(cats[:, j], minlength=7).tolist() == [30] * 7
+
+
+def test_unseeded_run_with_demographics():
+    model = ModelConfig(
+        project_name="NoSeed",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 3)],
+        sample=SampleConfig(n_respondents=50, random_seed=None),
+        demographics=DemographicConfig(add_demographics=True),
+    )
+
+    full_df, _ = generate_dataset(model)
+
+    assert full_df.shape == (50, 7)
+
+
+def test_single_construct_skips_thread_pool(monkeypatch):
+    import core.generator as gen
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool should not be used for one construct")
+
+    monkeypatch.setattr(gen, "ThreadPoolExecutor", no_pool)
+
+    model = ModelConfig(
+        project_name="Single",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 4)],
+        sample=SampleConfig(n_respondents=120, random_seed=4),
+        demographics=DemographicConfig(add_demographics=False),
+    )
+
+    full_df, items_df = gen.generate_dataset(model)
+
+    pd.testing.assert_frame_equal(full_df, items_df)
+    assert list(items_df.columns) == ["PE_01", "PE_02", "PE_03", "PE_04"]
+
+
+def test_return_arrow_requires_pyarrow(monkeypatch):
+    import core.generator as gen
+
+    monkeypatch.setattr(gen, "pa", None)
+    model = ModelConfig(
+        project_name="Arrow",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 3)],
+        sample=SampleConfig(n_respondents=30, random_seed=1),
+    )
+
+    with pytest.raises(ImportError):
+        gen.generate_dataset(model, return_arrow=True)
+
+
+def test_return_arrow_matches_dataframe_output():
+    pytest.importorskip("pyarrow")
+
+    model = ModelConfig(
+        project_name="Arrow",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 3), mk_construct("BI", 4)],
+        sample=SampleConfig(n_respondents=80, random_seed=6),
+    )
+
+    full_df, items_df = generate_dataset(model)
+    full_tbl, items_tbl = generate_dataset(model, return_arrow=True)
+
+    assert full_tbl.column_names == list(full_df.columns)
+    np.testing.assert_array_equal(items_tbl.to_pandas().to_numpy(), items_df.to_numpy())
+    assert full_tbl.column("gender").to_pylist() == full_df["gender"].astype(str).tolist()
+
+
+# ----------------------------------------------------------
+# 6. full_df and items_df do not share item storage
+# ----------------------------------------------------------
+@pytest.mark.parametrize("demographics", [True, False])
+def test_full_and_items_frames_are_independent(demographics):
+    model = ModelConfig(
+        project_name="Alias",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE", 3), mk_construct("BI", 3)],
+        sample=SampleConfig(n_respondents=50, random_seed=8),
+        demographics=DemographicConfig(add_demographics=demographics),
+    )
+
+    full_df, items_df = generate_dataset(model)
+    before = items_df.to_numpy().copy()
+
+    full_df.loc[0, "PE_01"] = 0
+    full_df["BI_02"] += 1
+
+    np.testing.assert_array_equal(items_df.to_numpy(), before)
@@ -11,6 +11,8 @@ from core.config import (
 )
 from core.structural import simulate_structural_latents
 
+from _helpers import _fast_corr
+
 
 # ----------------------------------------------------------
 # Utility construct factory
@@ -72,7 +74,7 @@ def test_single_path():
     df = simulate_structural_latents(model)
 
     # BI should correlate strongly with PE
-    corr = df["PE"].corr(df["BI"])
+    corr = _fast_corr(df["PE"], df["BI"])
     assert corr > 0.55
 
 
@@ -99,8 +101,8 @@ def test_multiple_parents():
     df = simulate_structural_latents(model)
 
     # Check correlations
-    assert df["PE"].corr(df["BI"]) > 0.40
-    assert df["EE"].corr(df["BI"]) > 0.30
+    assert _fast_corr(df["PE"], df["BI"]) > 0.40
+    assert _fast_corr(df["EE"], df["BI"]) > 0.30
 
 
 # ----------------------------------------------------------
@@ -125,7 +127,7 @@ def test_r2_accuracy():
     df = simulate_structural_latents(model)
 
     # Regression approximation of R²
-    corr = df["PE"].corr(df["BI"])
+    corr = _fast_corr(df["PE"], df["BI"])
     estimated_r2 = corr * corr
 
     # allow tolerance
@@ -177,3 +179,272 @@ def test_unreferenced_constructs_are_generated():
 
     assert "EE" in df.columns
     assert df["EE"].std() > 0.5  # must generate exogenously
+
+
+# ----------------------------------------------------------
+# 7. JSON view of the structural configuration
+# ----------------------------------------------------------
+def test_structural_config_to_dict():
+    cfg = StructuralConfig(
+        paths=[PathConfig(source="PE", target="BI", beta=0.5)],
+        r2_targets={"BI": 0.4},
+    )
+
+    raw = cfg.to_dict()
+
+    assert raw == {
+        "paths": [{"source": "PE", "target": "BI", "beta": 0.5}],
+        "r2_targets": {"BI": 0.4},
+    }
+
+
+# ----------------------------------------------------------
+# 8. Config-level cycle detection (longer loop)
+# ----------------------------------------------------------
+def test_config_detects_three_node_cycle():
+    cfg = StructuralConfig(
+        paths=[
+            PathConfig(source="A", target="B", beta=0.3),
+            PathConfig(source="B", target="C", beta=0.3),
+            PathConfig(source="C", target="A", beta=0.3),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        cfg.validate(["A", "B", "C"])
+
+
+# ----------------------------------------------------------
+# 9. Gaussian (Cholesky) path reproduces the implied correlations
+# ----------------------------------------------------------
+def test_gaussian_chain_implied_correlations():
+    constructs = [mk_construct("A"), mk_construct("B"), mk_construct("C", mean=3.0, sd=2.0)]
+
+    model = ModelConfig(
+        project_name="Chain",
+        researcher_name="Tester",
+        constructs=constructs,
+        sample=SampleConfig(n_respondents=20000, random_seed=5),
+        structural=StructuralConfig(
+            paths=[PathConfig("A", "B", 0.6), PathConfig("B", "C", 0.5)],
+            r2_targets={"B": 0.50, "C": 0.40},
+        ),
+    )
+
+    df = simulate_structural_latents(model)
+    corr = df.corr()
+
+    assert abs(corr.loc["A", "B"] ** 2 - 0.50) < 0.02
+    assert abs(corr.loc["B", "C"] ** 2 - 0.40) < 0.02
+    assert abs(corr.loc["A", "C"] - np.sqrt(0.50 * 0.40)) < 0.02
+    assert abs(df["C"].mean() - 3.0) < 0.05
+    assert abs(df["C"].std() - 2.0) < 0.05
+
+
+# ----------------------------------------------------------
+# 10. Topological order on a long, wide DAG
+# ----------------------------------------------------------
+def test_topological_sort_large_dag():
+    from core.structural import _build_graph, _topological_sort
+
+    # Layered DAG: every node in layer l feeds every node in layer l + 1
+    layers = [[f"L{l}_{i}" for i in range(8)] for l in range(25)]
+    paths = [
+        PathConfig(src, tgt, 0.1)
+        for upper, lower in zip(layers, layers[1:])
+        for src in upper
+        for tgt in lower
+    ]
+
+    names = [name for layer in reversed(layers) for name in layer]
+    order = _topological_sort(names, paths)
+    pos = {name: i for i, name in enumerate(order)}
+
+    assert len(order) == len(_build_graph(paths)[0]) == 200
+    assert all(pos[p.source] < pos[p.target] for p in paths)
+
+
+# ----------------------------------------------------------
+# 11. Latents are single precision on every generation path
+# ----------------------------------------------------------
+def test_latents_are_float32():
+    sample = SampleConfig(n_respondents=200, random_seed=3)
+    paths = StructuralConfig(paths=[PathConfig("A", "B", 0.5)], r2_targets={"B": 0.3})
+
+    for dists, structural in [
+        (("normal", "normal"), StructuralConfig()),
+        (("normal", "normal"), paths),
+        (("skewed", "normal"), paths),
+    ]:
+        model = ModelConfig(
+            project_name="Dtype",
+            researcher_name="Tester",
+            constructs=[mk_construct("A", dists[0]), mk_construct("B", dists[1])],
+            sample=sample,
+            structural=structural,
+        )
+
+        df = simulate_structural_latents(model)
+
+        assert (df.dtypes == np.float32).all()
+        assert list(df.columns) == ["A", "B"]
+
+
+# ----------------------------------------------------------
+# 12. Concurrent exogenous draws are reproducible
+# ----------------------------------------------------------
+def test_exogenous_block_is_reproducible():
+    dists = ["normal", "uniform", "lognormal", "skewed", "beta", "normal"]
+    model = ModelConfig(
+        project_name="Exo",
+        researcher_name="Tester",
+        constructs=[mk_construct(f"X{i}", d) for i, d in enumerate(dists)],
+        sample=SampleConfig(n_respondents=500, random_seed=17),
+    )
+
+    first = simulate_structural_latents(model)
+    second = simulate_structural_latents(model)
+
+    pd.testing.assert_frame_equal(first, second)
+    # Independent streams: no two constructs share a draw
+    assert np.abs(np.corrcoef(first.to_numpy().T) - np.eye(len(dists))).max() < 0.2
+
+
+# ----------------------------------------------------------
+# 13. Distribution dispatch table covers every supported type
+# ----------------------------------------------------------
+def test_exogenous_draw_table_covers_distribution_types():
+    from typing import get_args
+
+    from core.config import DistributionType
+    from core.structural import _EXOGENOUS_DRAWS, _generate_exogenous_latent
+
+    assert set(_EXOGENOUS_DRAWS) == set(get_args(DistributionType))
+
+    sample = SampleConfig(n_respondents=5000, random_seed=0)
+    for dist in ("normal", "uniform", "skewed", "beta"):
+        z = _generate_exogenous_latent(
+            mk_construct("X", dist, mean=2.0, sd=0.5), sample, np.random.default_rng(1)
+        )
+        assert abs(z.mean() - 2.0) < 0.05
+        assert abs(z.std() - 0.5) < 0.05
+
+
+# ----------------------------------------------------------
+# 14. Targets sharing a parent set (grouped predictor GEMM)
+# ----------------------------------------------------------
+def test_shared_parent_set_targets_hit_r2():
+    constructs = [
+        mk_construct("A", "skewed"),
+        mk_construct("B", "uniform"),
+        mk_construct("C"),
+        mk_construct("D"),
+    ]
+    model = ModelConfig(
+        project_name="Grouped",
+        researcher_name="Tester",
+        constructs=constructs,
+        sample=SampleConfig(n_respondents=20000, random_seed=11),
+        structural=StructuralConfig(
+            paths=[
+                PathConfig("A", "C", 0.5), PathConfig("B", "C", 0.2),
+                PathConfig("B", "D", 0.4), PathConfig("A", "D", -0.3),
+            ],
+            r2_targets={"C": 0.45, "D": 0.25},
+        ),
+    )
+
+    df = simulate_structural_latents(model)
+    X = np.column_stack([np.ones(len(df)), df[["A", "B"]].to_numpy(dtype=float)])
+
+    for target, r2 in [("C", 0.45), ("D", 0.25)]:
+        y = df[target].to_numpy(dtype=float)
+        resid = y - X @ np.linalg.lstsq(X, y, rcond=None)[0]
+        assert abs(1 - resid.var() / y.var() - r2) < 0.02
+
+
+# ----------------------------------------------------------
+# 15. Output follows construct order, not topological order
+# ----------------------------------------------------------
+def test_columns_follow_construct_order():
+    for dist in ("normal", "beta"):
+        model = ModelConfig(
+            project_name="Order",
+            researcher_name="Tester",
+            constructs=[mk_construct("BI"), mk_construct("EE"), mk_construct("PE", dist)],
+            sample=SampleConfig(n_respondents=300, random_seed=2),
+            structural=StructuralConfig(paths=[PathConfig("PE", "BI", 0.6), PathConfig("EE", "BI", 0.2)]),
+        )
+
+        df = simulate_structural_latents(model)
+
+        assert list(df.columns) == ["BI", "EE", "PE"]
+        assert _fast_corr(df["BI"], df["PE"]) > 0.3
+
+
+# ----------------------------------------------------------
+# 16. All-normal model without paths: one broadcast draw
+# ----------------------------------------------------------
+def test_independent_normal_latents_use_construct_moments():
+    constructs = [mk_construct("PE", mean=1.0, sd=0.5), mk_construct("EE", mean=-2.0, sd=3.0)]
+    model = ModelConfig(
+        project_name="Moments",
+        researcher_name="Tester",
+        constructs=constructs,
+        sample=SampleConfig(n_respondents=20000, random_seed=9),
+    )
+
+    df = simulate_structural_latents(model)
+
+    np.testing.assert_allclose(df.mean().to_numpy(), [1.0, -2.0], atol=0.05)
+    np.testing.assert_allclose(df.std().to_numpy(), [0.5, 3.0], rtol=0.03)
+    assert abs(_fast_corr(df["PE"], df["EE"])) < 0.03
+
+
+# ----------------------------------------------------------
+# 17. Undefined path constructs are reported together
+# ----------------------------------------------------------
+def test_undefined_path_constructs_reported_together():
+    model = ModelConfig(
+        project_name="Undefined",
+        researcher_name="Tester",
+        constructs=[mk_construct("PE")],
+        sample=SampleConfig(n_respondents=50, random_seed=1),
+        structural=StructuralConfig(paths=[PathConfig("PE", "BI", 0.4), PathConfig("SI", "BI", 0.2)]),
+    )
+
+    with pytest.raises(ValueError, match="'BI', 'SI'"):
+        simulate_structural_latents(model)
+
+
+# ----------------------------------------------------------
+# 18. Same seed, same latents, regardless of string hashing
+# ----------------------------------------------------------
+def test_latents_do_not_depend_on_hash_seed():
+    import os
+    import subprocess
+    import sys
+
+    script = (
+        "from core.config import *\n"
+        "from core.structural import simulate_structural_latents\n"
+        "mk = lambda n, d: ConstructConfig(name=n, n_items=3, distribution=d, skew=0.5)\n"
+        "m = ModelConfig(project_name='P', researcher_name='R',\n"
+        "    constructs=[mk('PE', 'skewed'), mk('EE', 'beta'), mk('SI', 'normal'), mk('BI', 'normal')],\n"
+        "    sample=SampleConfig(n_respondents=4, random_seed=1),\n"
+        "    structural=StructuralConfig(paths=[PathConfig('PE', 'BI', 0.4), PathConfig('EE', 'BI', 0.3),\n"
+        "                                       PathConfig('SI', 'BI', 0.2)]))\n"
+        "print(simulate_structural_latents(m).to_numpy().tobytes().hex())\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=root, capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+
+    assert len(outputs) == 1
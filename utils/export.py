@@ -20,6 +20,12 @@ This module is used by the Export Center.
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional, Tuple
+
 import pandas as pd
 import numpy as np
 
@@ -34,23 +40,85 @@ try:
 except ImportError:
     pyreadr = None
 
-# Optional lib for PDF generation
+# Optional fast JSON encoder (stdlib json is used otherwise)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming Excel writer (openpyxl is used otherwise)
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Optional libs for PDF generation (fpdf2 preferred, reportlab fallback)
+try:
+    from fpdf import FPDF
+except ImportError:
+    FPDF = None
+
 try:
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
     from reportlab.lib import colors
     from reportlab.lib.styles import getSampleStyleSheet
     from reportlab.lib.pagesizes import A4
-    pdf_available = True
+    reportlab_available = True
 except ImportError:
-    pdf_available = False
-
-from io import BytesIO
-from typing import Dict, List
+    reportlab_available = False
+
+pdf_available = FPDF is not None or reportlab_available
+
+__all__ = [
+    "pdf_available",
+    "generate_codebook",
+    "export_csv",
+    "export_excel_full",
+    "export_excel_smartpls",
+    "export_spss",
+    "export_stata",
+    "export_rds",
+    "export_metadata_json",
+    "export_codebook_pdf",
+    "export_codebook_html",
+    "export_bundle",
+]
 
 # =====================================================================
 # CODEBOOK GENERATION
 # =====================================================================
 
+# Codebook column order
+_CODEBOOK_COLUMNS = (
+    "variable", "construct", "item_label", "distribution",
+    "latent_mean", "latent_sd", "skew", "loading_target_mean",
+    "scale_min", "scale_max", "type",
+)
+
+_CODEBOOK_NUMERIC = {
+    "latent_mean", "latent_sd", "skew", "loading_target_mean", "scale_min", "scale_max",
+}
+
+
+def _codebook_block(n: int, **fields) -> Dict[str, np.ndarray]:
+    """
+    One codebook section as column arrays of length n. Columns not given are
+    empty: NaN for numeric fields, None otherwise.
+    """
+    block = {}
+    for col in _CODEBOOK_COLUMNS:
+        if col in fields:
+            block[col] = fields[col]
+        elif col in _CODEBOOK_NUMERIC:
+            block[col] = np.full(n, np.nan)
+        else:
+            block[col] = np.full(n, None, dtype=object)
+    return block
+
+
+_DEMOGRAPHIC_FIELDS = ("gender", "age_group", "income_band", "study_level")
+
+
 def generate_codebook(model_cfg, items_df, full_df):
     """
     Create a comprehensive metadata table for:
@@ -59,107 +127,319 @@ def generate_codebook(model_cfg, items_df, full_df):
     - structural paths
 
     Handles both list-based and dict-based construct configurations.
+    Tables are cached on exactly the inputs they read (frozen, hashable
+    configs), so re-exporting the same model reuses one build.
     """
-    rows = []
-
     # Constructs may be a dict or list (generator converts to dict internally)
     if isinstance(model_cfg.constructs, dict):
         constructs_list = list(model_cfg.constructs.values())
     else:
         constructs_list = list(model_cfg.constructs)
 
+    demographics = None
+    if model_cfg.demographics.add_demographics:
+        present = frozenset(full_df.columns)
+        demographics = tuple(c for c in _DEMOGRAPHIC_FIELDS if c in present)
+
+    paths = tuple(model_cfg.structural.paths) if model_cfg.structural else ()
+
+    codebook = _cached_codebook(
+        tuple(constructs_list),
+        model_cfg.sample.likert_min,
+        model_cfg.sample.likert_max,
+        demographics,
+        paths,
+    )
+    # Callers get their own frame; the cached one stays pristine
+    return codebook.copy()
+
+
+@lru_cache(maxsize=16)
+def _cached_codebook(
+    constructs_list: Tuple,
+    likert_min: int,
+    likert_max: int,
+    demographics: Optional[Tuple[str, ...]],
+    paths: Tuple,
+) -> pd.DataFrame:
+    """Column-wise codebook build: per-construct fields are repeated over their items."""
     # ---------------------------
     # Measurement Items
     # ---------------------------
-    for cons in constructs_list:
-        for i in range(1, cons.n_items + 1):
-            col = f"{cons.name}_{i:02d}"
-            rows.append({
-                "variable": col,
-                "construct": cons.name,
-                "item_label": f"Item {i}",
-                "distribution": cons.distribution,
-                "latent_mean": cons.latent_mean,
-                "latent_sd": cons.latent_sd,
-                "skew": cons.skew,
-                "loading_target_mean": cons.target_loading_mean,
-                "scale_min": model_cfg.sample.likert_min,
-                "scale_max": model_cfg.sample.likert_max,
-                "type": "Likert item",
-            })
+    counts = [cons.n_items for cons in constructs_list]
+    n_items = sum(counts)
+
+    def per_item(values, dtype=None):
+        return np.repeat(np.asarray(values, dtype=dtype), counts)
+
+    blocks = [_codebook_block(
+        n_items,
+        variable=np.array(
+            [f"{c.name}_{i:02d}" for c in constructs_list for i in range(1, c.n_items + 1)],
+            dtype=object,
+        ),
+        construct=per_item([c.name for c in constructs_list], object),
+        item_label=np.array([f"Item {i}" for n in counts for i in range(1, n + 1)], dtype=object),
+        distribution=per_item([c.distribution for c in constructs_list], object),
+        latent_mean=per_item([c.latent_mean for c in constructs_list]),
+        latent_sd=per_item([c.latent_sd for c in constructs_list]),
+        skew=per_item([c.skew for c in constructs_list]),
+        loading_target_mean=per_item([c.target_loading_mean for c in constructs_list]),
+        scale_min=np.full(n_items, likert_min),
+        scale_max=np.full(n_items, likert_max),
+        type=np.full(n_items, "Likert item", dtype=object),
+    )]
 
     # ---------------------------
     # Demographics
     # ---------------------------
-    if model_cfg.demographics.add_demographics:
-        demographic_fields = [
-            "gender", "age_group", "income_band", "study_level"
-        ]
-        for col in demographic_fields:
-            if col in full_df.columns:
-                rows.append({
-                    "variable": col,
-                    "construct": "demographic",
-                    "item_label": col,
-                    "distribution": "categorical",
-                    "latent_mean": None,
-                    "latent_sd": None,
-                    "skew": None,
-                    "loading_target_mean": None,
-                    "scale_min": None,
-                    "scale_max": None,
-                    "type": "category",
-                })
+    if demographics is not None:
+        present = np.array(demographics, dtype=object)
+        blocks.append(_codebook_block(
+            len(present),
+            variable=present,
+            construct=np.full(len(present), "demographic", dtype=object),
+            item_label=present,
+            distribution=np.full(len(present), "categorical", dtype=object),
+            type=np.full(len(present), "category", dtype=object),
+        ))
 
     # ---------------------------
     # Structural paths (appendix section)
     # ---------------------------
-    if model_cfg.structural and model_cfg.structural.paths:
-        for p in model_cfg.structural.paths:
-            rows.append({
-                "variable": f"{p.source} → {p.target}",
-                "construct": "structural_path",
-                "item_label": f"β = {p.beta:.3f}",
-                "distribution": None,
-                "latent_mean": None,
-                "latent_sd": None,
-                "skew": None,
-                "loading_target_mean": None,
-                "scale_min": None,
-                "scale_max": None,
-                "type": "structural_relation",
-            })
-
-    return pd.DataFrame(rows)
+    if paths:
+        blocks.append(_codebook_block(
+            len(paths),
+            variable=np.array([f"{p.source} → {p.target}" for p in paths], dtype=object),
+            construct=np.full(len(paths), "structural_path", dtype=object),
+            item_label=np.array([f"β = {p.beta:.3f}" for p in paths], dtype=object),
+            type=np.full(len(paths), "structural_relation", dtype=object),
+        ))
+
+    return pd.DataFrame(
+        {col: np.concatenate([b[col] for b in blocks]) for col in _CODEBOOK_COLUMNS},
+        copy=False,
+    )
 
 
 # =====================================================================
 # BASIC EXPORTS
 # =====================================================================
 
+def _decategorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Categorical columns (e.g. demographics) as plain labels for pyreadstat."""
+    cat_cols = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not cat_cols:
+        return df
+    return df.astype({c: object for c in cat_cols})
+
+
+def _narrow_items(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Integer (Likert) columns in one byte: uint8 / int8 when their range fits.
+    Generated items already arrive as int8, in which case df is returned as is.
+    """
+    narrow = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        if dtype.kind not in "iu" or dtype.itemsize == 1 or df[col].empty:
+            continue
+        lo, hi = df[col].min(), df[col].max()
+        if 0 <= lo and hi <= 255:
+            narrow[col] = np.uint8
+        elif -128 <= lo and hi <= 127:
+            narrow[col] = np.int8
+
+    return df.astype(narrow) if narrow else df
+
+
+def _column_values(df: pd.DataFrame) -> List[list]:
+    """Each column as a list of plain Python values, missing cells as None."""
+    return [df[c].astype(object).where(df[c].notna(), None).tolist() for c in df.columns]
+
+
+def _csv_field(text: str) -> str:
+    """Minimal CSV quoting, as pandas/csv.QUOTE_MINIMAL would write the field."""
+    if any(ch in text for ch in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _csv_tokens(col: pd.Series) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    A column as (token byte table, token lengths, per-row token index) when it
+    has a small fixed vocabulary — one-byte integers or categoricals — else None.
+    """
+    dtype = col.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        labels = [_csv_field(str(c)) for c in dtype.categories] + [""]
+        codes = col.cat.codes.to_numpy()
+        idx = np.where(codes < 0, len(labels) - 1, codes)  # missing → empty field
+    elif dtype.kind in "iu" and dtype.itemsize == 1:
+        values = col.to_numpy()
+        lo, hi = int(values.min()), int(values.max())
+        labels = [str(v) for v in range(lo, hi + 1)]
+        idx = values.astype(np.int16) - lo
+    else:
+        return None
+
+    encoded = [label.encode("utf-8") for label in labels]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    table = np.zeros((len(encoded), max(int(lengths.max()), 1)), dtype=np.uint8)
+    for i, token in enumerate(encoded):
+        table[i, :len(token)] = np.frombuffer(token, dtype=np.uint8)
+    return table, lengths, idx
+
+
+def _csv_bytes_tokenized(df: pd.DataFrame) -> Optional[bytes]:
+    """
+    CSV writer specialized to fixed-vocabulary columns: every cell is a lookup
+    into its column's token table, scattered into one byte buffer column by
+    column. Returns None when some column is not tokenizable.
+    """
+    if df.empty:
+        return None
+
+    columns = []
+    for name in df.columns:
+        tokens = _csv_tokens(df[name])
+        if tokens is None:
+            return None
+        columns.append(tokens)
+
+    header = (",".join(_csv_field(str(c)) for c in df.columns) + "\n").encode("utf-8")
+
+    # Row byte offsets: each cell is followed by one separator (',' or '\n')
+    row_len = np.full(len(df), len(columns), dtype=np.int64)
+    for _, lengths, idx in columns:
+        row_len += lengths[idx]
+    start = np.cumsum(row_len)
+    start += len(header) - row_len
+
+    buf = np.empty(len(header) + int(row_len.sum()), dtype=np.uint8)
+    buf[:len(header)] = np.frombuffer(header, dtype=np.uint8)
+
+    last = len(columns) - 1
+    for c, (table, lengths, idx) in enumerate(columns):
+        length = lengths[idx]
+        if lengths.min() == lengths.max():
+            # Fixed-width column (e.g. single-digit Likert codes): no masking
+            for j in range(int(lengths[0])):
+                buf[start + j] = table[:, j][idx]
+        else:
+            for j in range(table.shape[1]):
+                mask = length > j
+                buf[start[mask] + j] = table[:, j][idx[mask]]
+        start += length
+        buf[start] = ord("\n") if c == last else ord(",")
+        start += 1
+
+    return buf.tobytes()
+
+
 def export_csv(full_df: pd.DataFrame) -> bytes:
-    """Export dataset to CSV (UTF-8)."""
-    return full_df.to_csv(index=False).encode("utf-8")
+    """
+    Export dataset to CSV (UTF-8). Likert items and demographic categories go
+    through the token-table writer; anything else through pandas' writer, with
+    the same quoting, float formatting and line endings.
+    """
+    full_df = _narrow_items(full_df)
+    data = _csv_bytes_tokenized(full_df)
+    if data is not None:
+        return data
+
+    # Encode straight into the byte buffer: no intermediate full-size str
+    buf = BytesIO()
+    full_df.to_csv(buf, index=False, encoding="utf-8", lineterminator="\n")
+    return buf.getvalue()
 
 
 # =====================================================================
 # EXCEL EXPORTS
 # =====================================================================
 
-def export_excel_full(full_df: pd.DataFrame) -> bytes:
-    """Full dataset (demographics + items) in Excel."""
+def _excel_rows(df: pd.DataFrame) -> Tuple[bool, Iterable[list]]:
+    """
+    Body rows as plain Python values, and whether they are all integers.
+    Indicator-only frames (SmartPLS) convert in one NumPy call; otherwise
+    rows are stitched from column lists with missing cells as None (blanks).
+    """
+    if all(dtype.kind in "iu" for dtype in df.dtypes):
+        return True, df.to_numpy().tolist()
+    return False, zip(*_column_values(df))
+
+
+def _openpyxl_bytes(df: pd.DataFrame) -> bytes:
+    """openpyxl in write-only mode: rows appended as-is, no per-cell objects."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+
+    thin = Side(style="thin")
+    header = []
+    for name in df.columns:
+        cell = WriteOnlyCell(ws, value=str(name))
+        cell.font = Font(bold=True)
+        cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        cell.alignment = Alignment(horizontal="center")
+        header.append(cell)
+    ws.append(header)
+
+    for row in _excel_rows(df)[1]:
+        ws.append(row)
+
     buf = BytesIO()
-    full_df.to_excel(buf, index=False, engine="openpyxl")
+    wb.save(buf)
     return buf.getvalue()
 
 
-def export_excel_smartpls(items_df: pd.DataFrame) -> bytes:
-    """SmartPLS expected format: indicators only, numeric Excel."""
+def _excel_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Single-sheet .xlsx without the index. With xlsxwriter, rows are streamed in
+    constant-memory mode (one row held at a time) instead of openpyxl building
+    every cell object first. pandas' own xlsxwriter path writes column by
+    column, which constant-memory mode cannot take, so rows are written here.
+    """
+    df = _narrow_items(df)
+
+    if xlsxwriter is None:
+        return _openpyxl_bytes(df)
+
     buf = BytesIO()
-    items_df.to_excel(buf, index=False, engine="openpyxl")
+    wb = xlsxwriter.Workbook(buf, {"constant_memory": True})
+    ws = wb.add_worksheet("Sheet1")
+    header = wb.add_format({"bold": True, "border": 1, "align": "center"})
+    ws.write_row(0, 0, [str(c) for c in df.columns], header)
+
+    all_int, rows = _excel_rows(df)
+    if all_int:
+        # Integer cells go straight to write_number, skipping write_row's
+        # per-cell type dispatch
+        write_number = ws.write_number
+        for r, row in enumerate(rows, start=1):
+            for c, value in enumerate(row):
+                write_number(r, c, value)
+    else:
+        for r, row in enumerate(rows, start=1):
+            ws.write_row(r, 0, row)
+    wb.close()
+
     return buf.getvalue()
 
 
+def export_excel_full(full_df: pd.DataFrame) -> bytes:
+    """Full dataset (demographics + items) in Excel."""
+    return _excel_bytes(full_df)
+
+
+def export_excel_smartpls(items_df: pd.DataFrame) -> bytes:
+    """SmartPLS expected format: indicators only, numeric Excel."""
+    return _excel_bytes(items_df)
+
+
 # =====================================================================
 # SPSS, STATA, R
 # =====================================================================
@@ -169,7 +449,7 @@ def export_spss(full_df: pd.DataFrame) -> bytes:
     if pyreadstat is None:
         raise ImportError("pyreadstat not installed (SPSS export unavailable).")
     buf = BytesIO()
-    pyreadstat.write_sav(full_df, buf)
+    pyreadstat.write_sav(_decategorize(_narrow_items(full_df)), buf)
     return buf.getvalue()
 
 
@@ -178,7 +458,7 @@ def export_stata(full_df: pd.DataFrame) -> bytes:
     if pyreadstat is None:
         raise ImportError("pyreadstat not installed (STATA export unavailable).")
     buf = BytesIO()
-    pyreadstat.write_dta(full_df, buf)
+    pyreadstat.write_dta(_decategorize(_narrow_items(full_df)), buf)
     return buf.getvalue()
 
 
@@ -226,20 +506,116 @@ def export_metadata_json(model_cfg, codebook_df: pd.DataFrame) -> bytes:
             for p in (model_cfg.structural.paths if model_cfg.structural else [])
         ],
         "r2_targets": model_cfg.structural.r2_targets if model_cfg.structural else {},
-        "codebook": codebook_df.to_dict(orient="records"),
     }
 
-    return json.dumps(meta, indent=4).encode("utf-8")
+    if orjson is not None:
+        head, indent = orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY), b"  "
+    else:
+        head, indent = json.dumps(meta, indent=4).encode("utf-8"), b"    "
+
+    # Codebook records come straight from pandas' C JSON writer and are
+    # spliced in as the last key (empty fields serialize as null)
+    records = codebook_df.to_json(orient="records", double_precision=15, force_ascii=False)
+    return b"".join((head[:-2], b",\n", indent, b'"codebook": ', records.encode("utf-8"), b"\n}"))
 
 
 # =====================================================================
 # CODEBOOK PDF EXPORT
 # =====================================================================
 
+def _table_cells(df: pd.DataFrame) -> List[List[str]]:
+    """Body rows as strings, formatted column-wise (numeric via %g) in NumPy."""
+    if df.empty:
+        return []
+    cells = []
+    for col in df.columns:
+        arr = df[col].to_numpy()
+        cells.append(np.char.mod("%g", arr) if arr.dtype.kind in "fiu" else arr.astype(str))
+    return np.column_stack(cells).tolist()
+
+
+# fpdf2 core fonts are Latin-1 only
+_PDF_LATIN1 = str.maketrans({"→": "->", "β": "beta", "—": "-"})
+
+
+def _pdf_text(value) -> str:
+    return str(value).translate(_PDF_LATIN1).encode("latin-1", "replace").decode("latin-1")
+
+
+def _pdf_column_widths(texts: np.ndarray, total: float) -> np.ndarray:
+    """
+    Column widths sized from content: each column's longest entry (header
+    included), capped so one long label column cannot squeeze the rest.
+    """
+    longest = np.char.str_len(texts).max(axis=0)
+    natural = np.clip(longest, 4, 40).astype(float)
+    return natural * (total / natural.sum())
+
+
+def _codebook_pdf_fpdf(codebook_df: pd.DataFrame, title: str) -> bytes:
+    """
+    fpdf2 table; avoids reportlab's per-cell width measuring. Columns are sized
+    from their content and text that still does not fit is clipped with "...",
+    so no cell runs into its neighbour.
+    """
+    pdf = FPDF(orientation="L", unit="mm", format="A4")
+    pdf.set_auto_page_break(False)
+    pdf.add_page()
+
+    pdf.set_font("Helvetica", "B", 14)
+    pdf.cell(0, 10, _pdf_text(title))
+    pdf.ln()
+    pdf.set_font("Helvetica", size=9)
+    pdf.cell(0, 6, "Generated using DataSmartPLS4.0")
+    pdf.ln(8)
+
+    header = [_pdf_text(c) for c in codebook_df.columns]
+    body = [[_pdf_text(v) for v in row] for row in _table_cells(codebook_df)]
+    col_w = _pdf_column_widths(np.array([header] + body, dtype=str), pdf.epw)
+    room = col_w - 2 * pdf.c_margin
+    row_h = 5
+    bottom = pdf.h - pdf.b_margin
+
+    def fit(text, c, safe):
+        # Strings short enough to fit even in the widest glyphs skip measuring
+        if len(text) <= safe[c] or pdf.get_string_width(text) <= room[c]:
+            return text
+        while text and pdf.get_string_width(text + "...") > room[c]:
+            text = text[:-1]
+        return text + "..."
+
+    def set_font(style):
+        pdf.set_font("Helvetica", style, 7)
+        widest = max(pdf.get_string_width(ch) for ch in "@MW")
+        return (room // widest).astype(int)
+
+    def header_row():
+        safe = set_font("B")
+        pdf.set_fill_color(211, 211, 211)
+        for c, h in enumerate(header):
+            pdf.cell(col_w[c], row_h, fit(h, c, safe), border=1, fill=True)
+        pdf.ln()
+        return set_font("")
+
+    safe = header_row()
+    for row in body:
+        if pdf.get_y() + row_h > bottom:
+            pdf.add_page()
+            safe = header_row()
+        for c, v in enumerate(row):
+            pdf.cell(col_w[c], row_h, fit(v, c, safe), border=1)
+        pdf.ln()
+
+    return bytes(pdf.output())
+
+
 def export_codebook_pdf(codebook_df: pd.DataFrame, title="DataSmartPLS4.0 Codebook") -> bytes:
     """Generate a professional PDF codebook."""
     if not pdf_available:
-        raise ImportError("reportlab not installed — PDF export unavailable.")
+        raise ImportError("fpdf2/reportlab not installed — PDF export unavailable.")
+
+    if FPDF is not None:
+        return _codebook_pdf_fpdf(codebook_df, title)
 
     buf = BytesIO()
     doc = SimpleDocTemplate(buf, pagesize=A4)
@@ -252,7 +628,7 @@ def export_codebook_pdf(codebook_df: pd.DataFrame, title="DataSmartPLS4.0 Codebo
     ]
 
     # Table
-    data = [list(codebook_df.columns)] + codebook_df.astype(str).values.tolist()
+    data = [list(codebook_df.columns)] + _table_cells(codebook_df)
 
     table = Table(data, repeatRows=1)
     table.setStyle(TableStyle([
@@ -276,3 +652,59 @@ def export_codebook_html(codebook_df: pd.DataFrame) -> bytes:
     """Export the codebook as a readable HTML table."""
     html = codebook_df.to_html(index=False, border=1, classes="datasmartpls-table")
     return html.encode("utf-8")
+
+
+# =====================================================================
+# EXPORT BUNDLE ("download all")
+# =====================================================================
+
+# format → exporter over (model_cfg, items_df, full_df, codebook_df)
+_EXPORTERS = {
+    "csv": lambda cfg, items, full, cb: export_csv(full),
+    "excel_full": lambda cfg, items, full, cb: export_excel_full(full),
+    "excel_smartpls": lambda cfg, items, full, cb: export_excel_smartpls(items),
+    "spss": lambda cfg, items, full, cb: export_spss(full),
+    "stata": lambda cfg, items, full, cb: export_stata(full),
+    "rds": lambda cfg, items, full, cb: export_rds(full),
+    "codebook_csv": lambda cfg, items, full, cb: cb.to_csv(index=False).encode("utf-8"),
+    "codebook_html": lambda cfg, items, full, cb: export_codebook_html(cb),
+    "codebook_pdf": lambda cfg, items, full, cb: export_codebook_pdf(cb),
+    "metadata_json": lambda cfg, items, full, cb: export_metadata_json(cfg, cb),
+}
+
+
+def export_bundle(
+    model_cfg,
+    items_df: pd.DataFrame,
+    full_df: pd.DataFrame,
+    formats: Optional[Iterable[str]] = None,
+) -> Tuple[Dict[str, bytes], Dict[str, Exception]]:
+    """
+    Run several exporters concurrently over one shared codebook.
+
+    Returns (bytes by format, error by format). Formats whose optional library
+    is missing (ImportError) appear in neither; any other exporter failure is
+    reported in the second dict so the remaining formats are still returned.
+    """
+    formats = list(_EXPORTERS) if formats is None else list(formats)
+    unknown = [f for f in formats if f not in _EXPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {unknown}")
+
+    codebook_df = generate_codebook(model_cfg, items_df, full_df)
+
+    def run(fmt):
+        try:
+            return _EXPORTERS[fmt](model_cfg, items_df, full_df, codebook_df), None
+        except ImportError:
+            return None, None
+        except Exception as exc:
+            return None, exc
+
+    # The exporters are independent and spend most time in C writers
+    with ThreadPoolExecutor(max_workers=max(1, min(len(formats), os.cpu_count() or 1))) as pool:
+        results = dict(zip(formats, pool.map(run, formats)))
+
+    data = {fmt: out for fmt, (out, _) in results.items() if out is not None}
+    errors = {fmt: exc for fmt, (_, exc) in results.items() if exc is not None}
+    return data, errors